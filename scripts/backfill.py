@@ -22,10 +22,11 @@ be inaccurate for past months.
 
 from __future__ import annotations
 
-import calendar
 import logging
-import time
-from datetime import date
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
@@ -35,13 +36,38 @@ from rich.progress import Progress
 
 from seismic_risk.config import SeismicRiskConfig
 from seismic_risk.history import save_snapshot
-from seismic_risk.pipeline import run_pipeline
+from seismic_risk.http import create_session
+from seismic_risk.pipeline import PipelineInputs, fetch_inputs, score_inputs
 
 app = typer.Typer(help="Historical backfill for seismic risk snapshots.")
 console = Console()
 logger = logging.getLogger("seismic_risk.backfill")
 
 
+@lru_cache(maxsize=32)
+def _month_ranges(
+    start_year: int,
+    start_month: int,
+    end_year: int,
+    end_month: int,
+) -> tuple[tuple[date, date, date], ...]:
+    """Cached core of :func:`generate_month_ranges`, keyed by month only."""
+    stop = date(end_year, end_month, 1)
+    months: list[tuple[date, date, date]] = []
+    first_day = date(start_year, start_month, 1)
+
+    while first_day < stop:
+        if first_day.month == 12:
+            next_first = date(first_day.year + 1, 1, 1)
+        else:
+            next_first = date(first_day.year, first_day.month + 1, 1)
+        last_day = next_first - timedelta(days=1)
+        months.append((first_day, last_day, last_day))
+        first_day = next_first
+
+    return tuple(months)
+
+
 def generate_month_ranges(
     start_year: int,
     start_month: int,
@@ -56,25 +82,30 @@ def generate_month_ranges(
     if end_date is None:
         end_date = date.today()
 
-    months: list[tuple[date, date, date]] = []
-    year, month = start_year, start_month
-
-    while True:
-        first_day = date(year, month, 1)
-        if first_day >= date(end_date.year, end_date.month, 1):
-            break
+    return list(_month_ranges(start_year, start_month, end_date.year, end_date.month))
 
-        _, last_day_num = calendar.monthrange(year, month)
-        last_day = date(year, month, last_day_num)
-        months.append((first_day, last_day, last_day))
 
-        if month == 12:
-            year += 1
-            month = 1
-        else:
-            month += 1
+def _score_month(
+    inputs: PipelineInputs | None,
+    config: SeismicRiskConfig,
+    history_dir: Path,
+    scoring_method: str,
+    snapshot_date: date,
+) -> tuple[int, int]:
+    """Score one month's fetched inputs and save its snapshot.
 
-    return months
+    Runs in a worker process.  *inputs* is ``None`` for months with no
+    qualifying countries, which still get an (empty) snapshot.
+    Returns ``(country_count, exposed_airport_count)``.
+    """
+    results = score_inputs(inputs, config) if inputs is not None else []
+    save_snapshot(
+        results,
+        history_dir=history_dir,
+        scoring_method=scoring_method,
+        snapshot_date=snapshot_date,
+    )
+    return len(results), sum(len(r.exposed_airports) for r in results)
 
 
 @app.command()
@@ -94,6 +125,13 @@ def backfill(
     delay: Annotated[
         float, typer.Option("--delay", help="Seconds between API requests."),
     ] = 1.0,
+    workers: Annotated[
+        int, typer.Option("--workers", min=1, help="Months fetched concurrently."),
+    ] = 4,
+    cpu_workers: Annotated[
+        int | None,
+        typer.Option("--cpu-workers", min=1, help="Scoring processes (default: CPU count)."),
+    ] = None,
     min_quakes: Annotated[
         int, typer.Option("--min-quakes", help="Minimum quakes per country to qualify."),
     ] = 3,
@@ -129,13 +167,27 @@ def backfill(
     succeeded = 0
     failed = 0
 
-    with Progress(console=console) as progress:
+    # One pooled session shared by all workers; *delay* throttles requests
+    # across threads instead of serializing whole months.  It is entered
+    # first so it is closed last, even if a pool raises on shutdown.
+    # Threads overlap the HTTP fetches; scoring is pure CPU work, so it
+    # runs in worker processes to sidestep the GIL.  Workers are spawned
+    # rather than forked: the fetch threads may hold locks (geocoder,
+    # cache, HTTP pool) at the moment a fork would happen.
+    with (
+        create_session(pool_maxsize=workers, min_interval=delay) as session,
+        Progress(console=console, refresh_per_second=10) as progress,
+        ThreadPoolExecutor(max_workers=workers) as io_pool,
+        ProcessPoolExecutor(
+            max_workers=cpu_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as cpu_pool,
+    ):
         task = progress.add_task("Backfilling...", total=len(months))
 
+        fetches: dict[Future[PipelineInputs | None], tuple[str, SeismicRiskConfig, date]] = {}
         for first_day, last_day, snapshot_date in months:
             label = f"{first_day.year}-{first_day.month:02d}"
-            progress.update(task, description=f"Processing {label}...")
-
             config = SeismicRiskConfig(
                 min_magnitude=min_magnitude,
                 days_lookback=30,
@@ -146,28 +198,40 @@ def backfill(
                 starttime=first_day.isoformat(),
                 endtime=last_day.isoformat(),
             )
+            future = io_pool.submit(fetch_inputs, config, session)
+            fetches[future] = (label, config, snapshot_date)
 
+        # Hand each month to the process pool as soon as its fetch lands
+        scores: dict[Future[tuple[int, int]], str] = {}
+        for future in as_completed(fetches):
+            label, config, snapshot_date = fetches[future]
+            try:
+                inputs = future.result()
+            except Exception:
+                logger.exception("Failed to fetch %s", label)
+                failed += 1
+                progress.advance(task)
+                continue
+            score_future = cpu_pool.submit(
+                _score_month, inputs, config, history_dir, "heuristic", snapshot_date,
+            )
+            scores[score_future] = label
+
+        # Progress is only touched from this (main) thread; the label is
+        # refreshed every few months rather than on every completion.
+        for done, future in enumerate(as_completed(scores)):
+            label = scores[future]
+            if done % 4 == 0:
+                progress.update(task, description=f"Backfilling ({label})...")
             try:
-                results = run_pipeline(config)
-                save_snapshot(
-                    results,
-                    history_dir=history_dir,
-                    scoring_method="heuristic",
-                    snapshot_date=snapshot_date,
-                )
+                countries, airports = future.result()
                 succeeded += 1
-                logger.info(
-                    "%s: %d countries, %d exposed airports",
-                    label,
-                    len(results),
-                    sum(len(r.exposed_airports) for r in results),
-                )
+                logger.info("%s: %d countries, %d exposed airports", label, countries, airports)
             except Exception:
                 logger.exception("Failed to process %s", label)
                 failed += 1
 
             progress.advance(task)
-            time.sleep(delay)
 
     console.print(f"\n[green]Done![/green] {succeeded} succeeded, {failed} failed.")
     console.print(f"Snapshots saved to {history_dir}")
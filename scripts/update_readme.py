@@ -9,14 +9,26 @@ If output/history/ contains at least 2 snapshots, a "Trend" column is added
 showing score deltas vs the previous day.
 
 This script is standalone — it uses only stdlib and does not import seismic_risk.
+If ``orjson`` happens to be installed it is used to parse the JSON inputs.
 """
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _loads: Any = orjson.loads
+except ImportError:  # stdlib fallback; json.loads also accepts UTF-8 bytes
+    _loads = json.loads
 
 START_MARKER = "<!-- LATEST_RESULTS_START -->"
 END_MARKER = "<!-- LATEST_RESULTS_END -->"
@@ -29,18 +41,28 @@ HISTORY_DIR = ROOT / "output" / "history"
 _DELTA_THRESHOLD = 0.5
 
 
+@lru_cache(maxsize=1)
 def _load_previous_scores() -> dict[str, float] | None:
     """Load score map from the second-most-recent snapshot.
 
+    Snapshot files are named ``YYYY-MM-DD.json``, so the two newest are
+    picked by name in a single pass rather than sorting the whole history.
+
     Returns None if fewer than 2 snapshots exist.
     """
     if not HISTORY_DIR.is_dir():
         return None
-    files = sorted(HISTORY_DIR.glob("*.json"))
-    if len(files) < 2:
+    with os.scandir(HISTORY_DIR) as it:
+        names = heapq.nlargest(
+            2,
+            (
+                e.name for e in it
+                if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+            ),
+        )
+    if len(names) < 2:
         return None
-    with open(files[-2], encoding="utf-8") as f:
-        snapshot = json.load(f)
+    snapshot = _loads((HISTORY_DIR / names[1]).read_bytes())
     return {c["iso_alpha3"]: c["score"] for c in snapshot["countries"]}
 
 
@@ -48,9 +70,10 @@ def _trend_indicator(iso3: str, score: float, previous: dict[str, float] | None)
     """Return a trend string for a single country."""
     if previous is None:
         return ""
-    if iso3 not in previous:
+    prev = previous.get(iso3)
+    if prev is None:
         return "NEW"
-    delta = score - previous[iso3]
+    delta = score - prev
     if delta > _DELTA_THRESHOLD:
         return f"+{delta:.1f}"
     if delta < -_DELTA_THRESHOLD:
@@ -70,13 +93,9 @@ def build_table(data: list[dict]) -> str:
         "|--:|:--------|:----|------:|:------|-------:|---------:|:------|",
     ]
 
-    sorted_data = sorted(
-        data,
-        key=lambda r: r.get("seismic_hub_risk_score", 0),
-        reverse=True,
-    )
+    top = heapq.nlargest(10, data, key=lambda r: r.get("seismic_hub_risk_score", 0))
 
-    for i, r in enumerate(sorted_data[:10], 1):
+    for i, r in enumerate(top, 1):
         score = r["seismic_hub_risk_score"]
         trend = _trend_indicator(r["iso_alpha3"], score, previous)
         lines.append(
@@ -96,20 +115,28 @@ def main() -> None:
         print(f"No results file at {JSON_PATH}, skipping README update.")
         sys.exit(0)
 
-    readme_text = README_PATH.read_text(encoding="utf-8")
+    raw = README_PATH.read_bytes()
+    start_marker = START_MARKER.encode()
+    end_marker = END_MARKER.encode()
 
-    if START_MARKER not in readme_text or END_MARKER not in readme_text:
+    if start_marker not in raw or end_marker not in raw:
         print("README markers not found, skipping injection.")
         sys.exit(0)
 
-    data = json.loads(JSON_PATH.read_text(encoding="utf-8"))
+    data = _loads(JSON_PATH.read_bytes())
     table = build_table(data)
 
-    start_idx = readme_text.index(START_MARKER) + len(START_MARKER)
-    end_idx = readme_text.index(END_MARKER)
-
-    updated = readme_text[:start_idx] + "\n" + table + "\n" + readme_text[end_idx:]
-    README_PATH.write_text(updated, encoding="utf-8")
+    start_idx = raw.index(start_marker) + len(start_marker)
+    end_idx = raw.index(end_marker)
+
+    # Write to a sibling temp file and swap it in so an interrupted run
+    # never leaves a truncated README behind.
+    tmp_path = README_PATH.with_suffix(".md.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(raw[:start_idx])
+        f.write(b"\n" + table.encode("utf-8") + b"\n")
+        f.write(raw[end_idx:])
+    os.replace(tmp_path, README_PATH)
     print(f"README updated with {len(data)} countries.")
 
 
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import io
+import json
 import logging
-import tempfile
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
-from dataclasses import asdict
 from datetime import datetime, timezone
-from pathlib import Path
+from functools import partial
 from typing import Annotated, Any
 
 from fastapi import FastAPI, Query
@@ -19,44 +19,71 @@ from seismic_risk.config import OutputFormat, ScoringMethod, SeismicRiskConfig
 from seismic_risk.exporters import (
     export_csv,
     export_geojson,
+    export_geojson_seq,
     export_html,
     export_markdown,
+    json_default,
 )
+from seismic_risk.http import create_session
 from seismic_risk.models import CountryRiskResult
 from seismic_risk.pipeline import run_pipeline
 
 logger = logging.getLogger(__name__)
 
-_CONTENT_TYPES: dict[str, str] = {
-    "json": "application/json",
-    "geojson": "application/geo+json",
-    "html": "text/html; charset=utf-8",
-    "csv": "text/csv; charset=utf-8",
-    "markdown": "text/markdown; charset=utf-8",
-}
+ResponseBuilder = Callable[[list[CountryRiskResult]], Response]
+
+
+def _json_response(results: list[CountryRiskResult]) -> Response:
+    """Serialize results as a JSON array.
+
+    Encodes the dataclasses directly instead of materializing an
+    ``asdict`` copy and letting ``JSONResponse`` re-encode it.
+    """
+    content = json.dumps(
+        results,
+        default=json_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    )
+    return Response(content=content, media_type="application/json")
+
+
+def _make_handler(exporter: Any, media_type: str) -> ResponseBuilder:
+    """Bind an exporter and its content type into a response builder."""
+
+    def handler(results: list[CountryRiskResult]) -> Response:
+        buf = io.StringIO()
+        exporter(results, buf)
+        return Response(content=buf.getvalue(), media_type=media_type)
+
+    return handler
 
-_SUFFIX: dict[str, str] = {
-    "geojson": ".geojson",
-    "html": ".html",
-    "csv": ".csv",
-    "markdown": ".md",
-}
 
-_EXPORTERS: dict[str, Any] = {
-    "geojson": export_geojson,
-    "html": export_html,
-    "csv": export_csv,
-    "markdown": export_markdown,
+# Per-format response builders, composed once at import time
+_HANDLERS: dict[str, ResponseBuilder] = {
+    "json": _json_response,
+    "geojson": _make_handler(export_geojson, "application/geo+json"),
+    "geojsonl": _make_handler(export_geojson_seq, "application/x-ndjson"),
+    "html": _make_handler(export_html, "text/html; charset=utf-8"),
+    "csv": _make_handler(export_csv, "text/csv; charset=utf-8"),
+    "markdown": _make_handler(export_markdown, "text/markdown; charset=utf-8"),
 }
 
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
-    """Store startup state for the /health endpoint."""
+    """Store startup state for the /health endpoint and a shared HTTP session.
+
+    The session's connection pool is reused across ``/risk`` requests so
+    upstream TLS connections are not re-established on every call.
+    """
     application.state.start_time = datetime.now(tz=timezone.utc)
     application.state.last_run = None
     application.state.run_count = 0
+    application.state.http = create_session(pool_maxsize=32)
     yield
+    application.state.http.close()
 
 
 app = FastAPI(
@@ -67,28 +94,6 @@ app = FastAPI(
 )
 
 
-def _run_and_export(
-    results: list[CountryRiskResult],
-    fmt: OutputFormat,
-) -> Response:
-    """Serialize pipeline results into the requested format."""
-    if fmt == "json":
-        return JSONResponse(content=[asdict(r) for r in results])
-
-    exporter = _EXPORTERS[fmt]
-    suffix = _SUFFIX[fmt]
-
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-    try:
-        exporter(results, tmp_path)
-        content = tmp_path.read_text(encoding="utf-8")
-    finally:
-        tmp_path.unlink(missing_ok=True)
-
-    return Response(content=content, media_type=_CONTENT_TYPES[fmt])
-
-
 @app.get("/health")
 def health() -> dict[str, Any]:
     """Server health check with uptime, version, and run count."""
@@ -106,7 +111,7 @@ def health() -> dict[str, Any]:
 def get_risk(
     format: Annotated[
         OutputFormat, Query(description="Output format."),
-    ] = "json",
+    ] = OutputFormat.JSON,
     min_magnitude: Annotated[
         float, Query(ge=0.0, le=10.0, description="Minimum earthquake magnitude."),
     ] = 5.0,
@@ -124,15 +129,21 @@ def get_risk(
     ] = "large_airport",
     scorer: Annotated[
         ScoringMethod, Query(description="Scoring method."),
-    ] = "shakemap",
+    ] = ScoringMethod.SHAKEMAP,
     no_cache: Annotated[
         bool, Query(description="Disable disk caching."),
     ] = False,
+    connections: Annotated[
+        bool, Query(description="HTML only: include airport-to-quake connection lines."),
+    ] = True,
+    all_quakes: Annotated[
+        bool, Query(description="HTML only: include quakes not linked to an airport."),
+    ] = True,
 ) -> Response:
     """Run the seismic risk pipeline and return results.
 
     Query parameters mirror the CLI options.  The ``format`` param controls
-    the response content type (json, geojson, html, csv, markdown).
+    the response content type (json, geojson, geojsonl, html, csv, markdown).
     """
     config = SeismicRiskConfig(
         min_magnitude=min_magnitude,
@@ -145,7 +156,7 @@ def get_risk(
     )
 
     try:
-        results = run_pipeline(config)
+        results = run_pipeline(config, session=app.state.http)
     except Exception as exc:
         logger.exception("Pipeline failed")
         return JSONResponse(
@@ -156,4 +167,10 @@ def get_risk(
     app.state.last_run = datetime.now(tz=timezone.utc)
     app.state.run_count += 1
 
-    return _run_and_export(results, format)
+    handler = _HANDLERS[format]
+    if format == "html" and not (connections and all_quakes):
+        handler = _make_handler(
+            partial(export_html, include_connections=connections, include_all_quakes=all_quakes),
+            "text/html; charset=utf-8",
+        )
+    return handler(results)
@@ -1,10 +1,22 @@
-"""Simple file-based cache with TTL expiry."""
+"""Simple file-based cache with TTL expiry.
+
+Each entry is a single file, sharded by key hash: a fixed binary header
+(magic + write timestamp) followed by the raw payload.  Writes go to a
+temporary file and are moved into place with ``os.replace`` so readers
+never observe a partially written entry.  Recently used entries are also
+kept in memory so repeated lookups within one process skip the disk.
+"""
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import math
+import os
+import struct
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -15,6 +27,19 @@ _CACHE_DIR = Path.home() / ".cache" / "seismic-risk"
 AIRPORTS_TTL = 86400  # 24 hours
 COUNTRIES_TTL = 604800  # 7 days
 
+_MAGIC = b"SRC1"
+_HEADER = struct.Struct("<4sd")  # magic, unix timestamp
+
+# The in-process LRU is bounded by total payload size as well as entry
+# count, and payloads above a quarter of the budget (e.g. the full airports
+# CSV or a large ShakeMap grid) are never held in memory at all.
+_MEMORY_MAX_ENTRIES = 32
+_MEMORY_MAX_BYTES = 16 << 20
+_MEMORY_MAX_ENTRY_BYTES = _MEMORY_MAX_BYTES // 4
+_memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_memory_bytes = 0
+_memory_lock = threading.Lock()
+
 
 def get_cache_dir() -> Path:
     """Return the cache directory, creating it if needed."""
@@ -22,32 +47,117 @@ def get_cache_dir() -> Path:
     return _CACHE_DIR
 
 
-def cache_get(key: str, max_age_seconds: int) -> bytes | None:
-    """Return cached bytes if fresh, else None."""
-    cache_dir = get_cache_dir()
-    data_path = cache_dir / key
-    meta_path = cache_dir / f"{key}.meta"
+def _key_path(key: str) -> Path:
+    """Return the on-disk path for *key*, sharded by hash prefix.
 
-    if not data_path.exists() or not meta_path.exists():
-        return None
+    Entries live in 256 subdirectories named by the first two hex digits
+    of the key's BLAKE2b hash (as git does for loose objects).  No
+    directories are created here; lookups stay free of extra syscalls and
+    ``cache_put`` creates the shard on write.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return _CACHE_DIR / digest[:2] / digest[2:]
+
+
+def _remember(path: Path, timestamp: float, data: bytes) -> None:
+    """Store an entry in the in-process LRU, evicting to stay within budget."""
+    global _memory_bytes
+    key = str(path)
+    with _memory_lock:
+        previous = _memory.pop(key, None)
+        if previous is not None:
+            _memory_bytes -= len(previous[1])
+        if len(data) > _MEMORY_MAX_ENTRY_BYTES:
+            return
+        _memory[key] = (timestamp, data)
+        _memory_bytes += len(data)
+        while len(_memory) > _MEMORY_MAX_ENTRIES or _memory_bytes > _MEMORY_MAX_BYTES:
+            _, (_, evicted) = _memory.popitem(last=False)
+            _memory_bytes -= len(evicted)
+
+
+def cache_get_entry(key: str, max_age_seconds: float) -> tuple[float, bytes] | None:
+    """Return ``(written_at, bytes)`` if fresh, else None.
+
+    *written_at* is the entry's stored timestamp, so callers that keep the
+    payload elsewhere can expire it on the same schedule.
+    """
+    data_path = _key_path(key)
+
+    with _memory_lock:
+        entry = _memory.get(str(data_path))
+        if entry is not None:
+            _memory.move_to_end(str(data_path))
+    if entry is not None and time.time() - entry[0] <= max_age_seconds:
+        logger.debug("Memory cache hit for %s", key)
+        return entry
 
     try:
-        meta = json.loads(meta_path.read_text())
-        if time.time() - meta["timestamp"] > max_age_seconds:
-            logger.debug("Cache expired for %s", key)
-            return None
-    except (json.JSONDecodeError, KeyError):
+        with data_path.open("rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, timestamp = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                return None
+            if time.time() - timestamp > max_age_seconds:
+                logger.debug("Cache expired for %s", key)
+                return None
+            data = f.read()
+    except FileNotFoundError:
         return None
 
     logger.debug("Cache hit for %s", key)
-    return data_path.read_bytes()
+    _remember(data_path, timestamp, data)
+    return timestamp, data
+
+
+def cache_get(key: str, max_age_seconds: float) -> bytes | None:
+    """Return cached bytes if fresh, else None."""
+    entry = cache_get_entry(key, max_age_seconds)
+    return None if entry is None else entry[1]
 
 
 def cache_put(key: str, data: bytes) -> None:
     """Store bytes in cache with current timestamp."""
-    cache_dir = get_cache_dir()
-    (cache_dir / key).write_bytes(data)
-    (cache_dir / f"{key}.meta").write_text(
-        json.dumps({"timestamp": time.time()})
+    data_path = _key_path(key)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = time.time()
+    tmp_path = data_path.with_name(
+        f"{data_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
     )
+    tmp_path.write_bytes(_HEADER.pack(_MAGIC, timestamp) + data)
+    os.replace(tmp_path, data_path)
+    _remember(data_path, timestamp, data)
     logger.debug("Cached %s (%d bytes)", key, len(data))
+
+
+def cache_get_stale(key: str) -> bytes | None:
+    """Return cached bytes whatever their age, e.g. to revalidate upstream."""
+    return cache_get(key, max_age_seconds=math.inf)
+
+
+def cache_touch(key: str) -> bool:
+    """Mark an entry fresh again without rewriting its payload.
+
+    Only the fixed-size header timestamp is overwritten in place.  Returns
+    False if there is no valid entry for *key*.
+    """
+    data_path = _key_path(key)
+    timestamp = time.time()
+    try:
+        with data_path.open("r+b") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size or _HEADER.unpack(header)[0] != _MAGIC:
+                return False
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, timestamp))
+    except FileNotFoundError:
+        return False
+
+    with _memory_lock:
+        entry = _memory.get(str(data_path))
+        if entry is not None:
+            _memory[str(data_path)] = (timestamp, entry[1])
+    logger.debug("Refreshed %s", key)
+    return True
@@ -16,6 +16,7 @@ from seismic_risk.config import OutputFormat, ScoringMethod, SeismicRiskConfig
 from seismic_risk.exporters import (
     export_csv,
     export_geojson,
+    export_geojson_seq,
     export_html,
     export_json,
     export_markdown,
@@ -28,11 +29,19 @@ Exporter = Callable[[list[CountryRiskResult], Path], Path]
 EXPORTERS: dict[str, Exporter] = {
     "json": export_json,
     "geojson": export_geojson,
+    "geojsonl": export_geojson_seq,
     "html": export_html,
     "csv": export_csv,
     "markdown": export_markdown,
 }
 
+_ALERT_DISPLAY: dict[str, str] = {
+    "red": "[red]red[/red]",
+    "orange": "[dark_orange]orange[/dark_orange]",
+    "yellow": "[yellow]yellow[/yellow]",
+    "green": "[green]green[/green]",
+}
+
 app = typer.Typer(
     name="seismic-risk",
     help="Real-time seismic risk scoring for global aviation infrastructure.",
@@ -91,15 +100,17 @@ def run(
     ] = Path("seismic_risk_output.json"),
     output_format: Annotated[
         OutputFormat,
-        typer.Option("--format", "-f", help="Output format: json, geojson, html, csv, markdown."),
-    ] = "json",
+        typer.Option(
+            "--format", "-f", help="Output format: json, geojson, geojsonl, html, csv, markdown."
+        ),
+    ] = OutputFormat.JSON,
     scorer: Annotated[
         ScoringMethod,
         typer.Option(
             "--scorer",
             help="Scoring method: 'shakemap' (PGA-based hybrid), 'heuristic', or 'legacy'.",
         ),
-    ] = "shakemap",
+    ] = ScoringMethod.SHAKEMAP,
     verbose: Annotated[
         bool,
         typer.Option("--verbose", "-v", help="Enable verbose logging."),
@@ -112,6 +123,23 @@ def run(
         Path | None,
         typer.Option("--history-dir", help="Directory for daily snapshot history."),
     ] = None,
+    html_gzip: Annotated[
+        bool,
+        typer.Option("--html-gzip", help="HTML only: also write a gzip copy (<output>.gz)."),
+    ] = False,
+    no_connections: Annotated[
+        bool,
+        typer.Option(
+            "--no-connections", help="HTML only: leave out airport-to-quake connection lines."
+        ),
+    ] = False,
+    linked_quakes_only: Annotated[
+        bool,
+        typer.Option(
+            "--linked-quakes-only",
+            help="HTML only: embed only quakes linked to an exposed airport.",
+        ),
+    ] = False,
 ) -> None:
     """Run the seismic risk assessment pipeline."""
     log_level = logging.DEBUG if verbose else logging.INFO
@@ -156,11 +184,17 @@ def run(
         trends = compute_trends(prior_history, results, config.scoring_method)
         save_snapshot(results, config.history_dir, config.scoring_method)
 
-    if trends is not None and config.output_format in ("html", "markdown"):
-        if config.output_format == "html":
-            export_html(results, config.output_file, trends=trends)
-        else:
-            export_markdown(results, config.output_file, trends=trends)
+    if config.output_format == "html":
+        export_html(
+            results,
+            config.output_file,
+            trends=trends,
+            compress=html_gzip,
+            include_connections=not no_connections,
+            include_all_quakes=not linked_quakes_only,
+        )
+    elif trends is not None and config.output_format == "markdown":
+        export_markdown(results, config.output_file, trends=trends)
     else:
         exporter = EXPORTERS[config.output_format]
         exporter(results, config.output_file)
@@ -175,12 +209,9 @@ def run(
     table.add_column("Alert")
 
     for r in results:
-        alert_display = {
-            "red": "[red]red[/red]",
-            "orange": "[dark_orange]orange[/dark_orange]",
-            "yellow": "[yellow]yellow[/yellow]",
-            "green": "[green]green[/green]",
-        }.get(r.highest_pager_alert or "", r.highest_pager_alert or "-")
+        alert_display = _ALERT_DISPLAY.get(
+            r.highest_pager_alert or "", r.highest_pager_alert or "-"
+        )
 
         table.add_row(
             r.country,
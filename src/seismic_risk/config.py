@@ -2,24 +2,52 @@
 
 from __future__ import annotations
 
+from enum import Enum
 from pathlib import Path
-from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
-ScoringMethod = Literal["shakemap", "heuristic", "exposure", "legacy"]
-OutputFormat = Literal["json", "geojson", "html", "csv", "markdown"]
+
+class _StrEnum(str, Enum):
+    """String-valued enum that compares, hashes and formats as its value.
+
+    Equivalent to ``enum.StrEnum`` (Python 3.11+), which 3.10 lacks.
+    """
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+class ScoringMethod(_StrEnum):
+    """Risk scoring method."""
+
+    SHAKEMAP = "shakemap"
+    HEURISTIC = "heuristic"
+    EXPOSURE = "exposure"
+    LEGACY = "legacy"
+
+
+class OutputFormat(_StrEnum):
+    """Output file format."""
+
+    JSON = "json"
+    GEOJSON = "geojson"
+    GEOJSONL = "geojsonl"
+    HTML = "html"
+    CSV = "csv"
+    MARKDOWN = "markdown"
 
 
 class SeismicRiskConfig(BaseSettings):
     """All configurable parameters for the seismic risk pipeline.
 
     Values can be set via constructor arguments, environment variables
-    prefixed with SEISMIC_RISK_, or defaults.
+    prefixed with SEISMIC_RISK_, or defaults.  Instances are frozen and
+    therefore hashable, so a config can key memoized helpers.
     """
 
-    model_config = {"env_prefix": "SEISMIC_RISK_"}
+    model_config = {"env_prefix": "SEISMIC_RISK_", "frozen": True}
 
     min_magnitude: float = Field(
         default=5.0, ge=0.0, le=10.0, description="Minimum earthquake magnitude."
@@ -43,10 +71,11 @@ class SeismicRiskConfig(BaseSettings):
         default=Path("seismic_risk_output.json"), description="Output file path."
     )
     output_format: OutputFormat = Field(
-        default="json", description="Output format: json, geojson, html, csv, or markdown."
+        default=OutputFormat.JSON,
+        description="Output format: json, geojson, geojsonl, html, csv, or markdown.",
     )
     scoring_method: ScoringMethod = Field(
-        default="shakemap",
+        default=ScoringMethod.SHAKEMAP,
         description=(
             "Scoring method: 'shakemap' (PGA-based hybrid, default), "
             "'heuristic' (distance-weighted), or 'legacy'."
@@ -11,8 +11,11 @@ Used for HTML visualization marker sizing only — not for risk scoring.
 Update periodically from the sources above.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # IATA code -> approximate annual aircraft movements (thousands)
-AIRPORT_MOVEMENTS: dict[str, float] = {
+_AIRPORT_MOVEMENTS_RAW: dict[str, float] = {
     # North America
     "ATL": 900.0,   # Atlanta Hartsfield-Jackson
     "DFW": 680.0,   # Dallas/Fort Worth
@@ -207,6 +210,9 @@ AIRPORT_MOVEMENTS: dict[str, float] = {
     "TAS": 40.0,    # Tashkent
 }
 
+AIRPORT_MOVEMENTS: Mapping[str, float] = MappingProxyType(_AIRPORT_MOVEMENTS_RAW)
+"""Read-only view of the lookup table above."""
+
 DEFAULT_MOVEMENTS: float = 10.0
 """Fallback for airports not in the lookup (thousands).
 
@@ -1,9 +1,17 @@
 """Exporters for seismic risk results."""
 
 from seismic_risk.exporters.csv_export import export_csv
-from seismic_risk.exporters.geojson_export import export_geojson
+from seismic_risk.exporters.geojson_export import export_geojson, export_geojson_seq
 from seismic_risk.exporters.html_export import export_html
-from seismic_risk.exporters.json_export import export_json
+from seismic_risk.exporters.json_export import export_json, json_default
 from seismic_risk.exporters.markdown_export import export_markdown
 
-__all__ = ["export_csv", "export_geojson", "export_html", "export_json", "export_markdown"]
+__all__ = [
+    "export_csv",
+    "export_geojson",
+    "export_geojson_seq",
+    "export_html",
+    "export_json",
+    "export_markdown",
+    "json_default",
+]
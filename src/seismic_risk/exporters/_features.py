@@ -0,0 +1,67 @@
+"""Feature-building helpers shared by the GeoJSON and HTML exporters."""
+
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
+
+from seismic_risk.models import ExposedAirport
+
+_MS_PER_DAY = 86_400_000
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _day_str(day_index: int) -> str:
+    """Return the UTC ``YYYY-MM-DD`` date for a day count since the Unix epoch."""
+    return date.fromordinal(day_index + _UNIX_EPOCH_ORDINAL).isoformat()
+
+
+def utc_day(time_ms: int) -> str:
+    """Return the UTC ``YYYY-MM-DD`` date of a millisecond Unix timestamp.
+
+    Events cluster on few distinct days, so the formatting is memoized per
+    day rather than done per event.
+    """
+    return _day_str(time_ms // _MS_PER_DAY)
+
+
+# One C-level call fetches every NearbyQuake field a connection needs;
+# there is one connection per airport-quake pair, the most numerous feature.
+_connection_fields = attrgetter(
+    "longitude", "latitude", "earthquake_id", "distance_km", "exposure_contribution", "pga_g", "mmi"
+)
+
+
+def make_connection_feature(
+    airport: ExposedAirport,
+    nq: Any,
+    *,
+    tagged: bool = True,
+) -> dict[str, Any]:
+    """Create a GeoJSON LineString connecting an airport to a nearby earthquake.
+
+    With ``tagged=False`` the ``feature_type`` property is left out, for
+    callers that already keep features grouped by type.
+    """
+    lon, lat, earthquake_id, distance_km, contribution, pga_g, mmi = _connection_fields(nq)
+    properties: dict[str, Any] = {"feature_type": "connection"} if tagged else {}
+    properties["airport_iata"] = airport.iata_code
+    properties["earthquake_id"] = earthquake_id
+    properties["distance_km"] = distance_km
+    properties["exposure_contribution"] = contribution
+    properties["pga_g"] = pga_g
+    properties["mmi"] = mmi
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [
+                [airport.longitude, airport.latitude],
+                [lon, lat],
+            ],
+        },
+        "properties": properties,
+    }
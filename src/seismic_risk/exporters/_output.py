@@ -0,0 +1,32 @@
+"""Shared output-target handling for exporters."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TypeVar
+
+OutputTarget = TypeVar("OutputTarget", Path, IO[str])
+"""Exporters accept a file path or an open text stream and return it unchanged."""
+
+# Exporters issue many small writes (one per row or feature); a 1 MiB
+# buffer keeps the number of write() syscalls low.
+_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def open_output(output: Path | IO[str], newline: str | None = None) -> Iterator[IO[str]]:
+    """Yield a writable text stream for *output*.
+
+    Paths are opened as UTF-8 with a large write buffer and closed on exit.  Streams (e.g.
+    ``io.StringIO``) are yielded as-is and left open for the caller.
+    """
+    if isinstance(output, (str, os.PathLike)):
+        with open(
+            output, "w", buffering=_BUFFER_SIZE, encoding="utf-8", newline=newline
+        ) as f:
+            yield f
+    else:
+        yield output
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import csv
-from pathlib import Path
+from collections.abc import Callable, Iterator
+from operator import attrgetter
+from typing import Any
 
-from seismic_risk.models import CountryRiskResult
+from seismic_risk.exporters._output import OutputTarget, open_output
+from seismic_risk.models import CountryRiskResult, ExposedAirport
 
 FIELDNAMES = [
     "country",
@@ -34,50 +37,66 @@ FIELDNAMES = [
     "max_mmi",
 ]
 
+_EXPOSURE_KEY = attrgetter("exposure_score")
+
+# Airport columns "airport_name" through "nearby_quake_count", in FIELDNAMES order.
+_AIRPORT_COLUMNS: Callable[[ExposedAirport], tuple[Any, ...]] = attrgetter(
+    "name",
+    "iata_code",
+    "municipality",
+    "latitude",
+    "longitude",
+    "closest_quake_distance_km",
+    "exposure_score",
+    "nearby_quake_count",
+)
+
+
+def _iter_rows(results: list[CountryRiskResult]) -> Iterator[tuple[Any, ...]]:
+    """Yield one row per exposed airport, in FIELDNAMES order."""
+    for result in results:
+        strongest = result.strongest_earthquake
+        country_columns: tuple[Any, ...] = (
+            result.country,
+            result.iso_alpha3,
+            result.iso_alpha2,
+            result.region,
+            result.capital,
+            result.population,
+            result.seismic_hub_risk_score,
+            result.earthquake_count,
+            round(result.avg_magnitude, 2),
+            result.highest_pager_alert or "",
+            result.tsunami_warning_issued,
+            result.significant_events_count,
+        )
+        strongest_mag = strongest.magnitude if strongest else ""
+        strongest_date = strongest.date if strongest else ""
+        # find_exposed_airports() already returns this order, so the
+        # sort is a single linear pass; it only reorders hand-built results.
+        for airport in sorted(result.exposed_airports, key=_EXPOSURE_KEY, reverse=True):
+            pga_vals = [nq.pga_g for nq in airport.nearby_quakes if nq.pga_g is not None]
+            mmi_vals = [nq.mmi for nq in airport.nearby_quakes if nq.mmi is not None]
+            yield (
+                country_columns
+                + _AIRPORT_COLUMNS(airport)
+                + (
+                    strongest_mag,
+                    strongest_date,
+                    max(pga_vals) if pga_vals else "",
+                    max(mmi_vals) if mmi_vals else "",
+                )
+            )
+
 
 def export_csv(
     results: list[CountryRiskResult],
-    output_path: Path,
-) -> Path:
+    output_path: OutputTarget,
+) -> OutputTarget:
     """Export risk results as a flat CSV with one row per exposed airport."""
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-
-        for result in results:
-            strongest = result.strongest_earthquake
-            for airport in sorted(
-                result.exposed_airports,
-                key=lambda a: a.exposure_score,
-                reverse=True,
-            ):
-                pga_vals = [nq.pga_g for nq in airport.nearby_quakes if nq.pga_g is not None]
-                mmi_vals = [nq.mmi for nq in airport.nearby_quakes if nq.mmi is not None]
-                writer.writerow({
-                    "country": result.country,
-                    "iso_alpha3": result.iso_alpha3,
-                    "iso_alpha2": result.iso_alpha2,
-                    "region": result.region,
-                    "capital": result.capital,
-                    "population": result.population,
-                    "risk_score": result.seismic_hub_risk_score,
-                    "earthquake_count": result.earthquake_count,
-                    "avg_magnitude": round(result.avg_magnitude, 2),
-                    "pager_alert": result.highest_pager_alert or "",
-                    "tsunami_warning": result.tsunami_warning_issued,
-                    "significant_events": result.significant_events_count,
-                    "airport_name": airport.name,
-                    "iata_code": airport.iata_code,
-                    "municipality": airport.municipality,
-                    "latitude": airport.latitude,
-                    "longitude": airport.longitude,
-                    "closest_quake_km": airport.closest_quake_distance_km,
-                    "exposure_score": airport.exposure_score,
-                    "nearby_quake_count": len(airport.nearby_quakes),
-                    "strongest_quake_mag": strongest.magnitude if strongest else "",
-                    "strongest_quake_date": strongest.date if strongest else "",
-                    "max_pga_g": max(pga_vals) if pga_vals else "",
-                    "max_mmi": max(mmi_vals) if mmi_vals else "",
-                })
+    with open_output(output_path, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(_iter_rows(results))
 
     return output_path
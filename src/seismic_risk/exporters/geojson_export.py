@@ -3,40 +3,58 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
-from seismic_risk.geo import felt_radius_km
+from seismic_risk.exporters._features import make_connection_feature, utc_day
+from seismic_risk.exporters._output import OutputTarget, open_output
 from seismic_risk.models import CountryRiskResult, Earthquake, ExposedAirport
 
+# Shared encoder: json.dumps() with non-default options builds a new
+# JSONEncoder on every call, which adds up at one call per feature.
+# Compact separators drop the whitespace after every ',' and ':'.
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _country_props(country_result: CountryRiskResult) -> dict[str, Any]:
+    """Country-level properties shared by every airport feature of a country."""
+    return {
+        "country": country_result.country,
+        "iso_alpha2": country_result.iso_alpha2,
+        "iso_alpha3": country_result.iso_alpha3,
+        "country_risk_score": country_result.seismic_hub_risk_score,
+        "earthquake_count": country_result.earthquake_count,
+        "pager_alert": country_result.highest_pager_alert,
+    }
+
 
 def _make_airport_feature(
     airport: ExposedAirport,
-    country_result: CountryRiskResult,
+    country_props: dict[str, Any],
 ) -> dict[str, Any]:
-    """Create a GeoJSON Feature for an airport."""
+    """Create a GeoJSON Feature for an airport.
+
+    *country_props* comes from :func:`_country_props` and is built once per
+    country rather than once per airport.
+    """
+    properties = {
+        "feature_type": "airport",
+        "name": airport.name,
+        "iata_code": airport.iata_code,
+        "municipality": airport.municipality,
+        "closest_quake_km": airport.closest_quake_distance_km,
+        "exposure_score": airport.exposure_score,
+        "nearby_quake_count": airport.nearby_quake_count,
+    }
+    properties.update(country_props)
     return {
         "type": "Feature",
         "geometry": {
             "type": "Point",
             "coordinates": [airport.longitude, airport.latitude],
         },
-        "properties": {
-            "feature_type": "airport",
-            "name": airport.name,
-            "iata_code": airport.iata_code,
-            "municipality": airport.municipality,
-            "country": country_result.country,
-            "iso_alpha2": country_result.iso_alpha2,
-            "iso_alpha3": country_result.iso_alpha3,
-            "closest_quake_km": airport.closest_quake_distance_km,
-            "exposure_score": airport.exposure_score,
-            "nearby_quake_count": len(airport.nearby_quakes),
-            "country_risk_score": country_result.seismic_hub_risk_score,
-            "earthquake_count": country_result.earthquake_count,
-            "pager_alert": country_result.highest_pager_alert,
-        },
+        "properties": properties,
     }
 
 
@@ -45,9 +63,7 @@ def _make_earthquake_feature(
     country_result: CountryRiskResult,
 ) -> dict[str, Any]:
     """Create a GeoJSON Feature for an earthquake."""
-    date_str = datetime.fromtimestamp(
-        earthquake.time_ms / 1000, tz=timezone.utc
-    ).strftime("%Y-%m-%d")
+    date_str = utc_day(earthquake.time_ms)
     return {
         "type": "Feature",
         "geometry": {
@@ -59,7 +75,7 @@ def _make_earthquake_feature(
             "earthquake_id": earthquake.id,
             "magnitude": earthquake.magnitude,
             "depth_km": earthquake.depth_km,
-            "felt_radius_km": felt_radius_km(earthquake.magnitude, earthquake.depth_km),
+            "felt_radius_km": earthquake.felt_radius_km,
             "date": date_str,
             "place": earthquake.place,
             "country": country_result.country,
@@ -68,36 +84,35 @@ def _make_earthquake_feature(
     }
 
 
-def _make_connection_feature(
-    airport: ExposedAirport,
-    nq: Any,
-) -> dict[str, Any]:
-    """Create a GeoJSON LineString connecting an airport to a nearby earthquake."""
-    return {
-        "type": "Feature",
-        "geometry": {
-            "type": "LineString",
-            "coordinates": [
-                [airport.longitude, airport.latitude],
-                [nq.longitude, nq.latitude],
-            ],
-        },
-        "properties": {
-            "feature_type": "connection",
-            "airport_iata": airport.iata_code,
-            "earthquake_id": nq.earthquake_id,
-            "distance_km": nq.distance_km,
-            "exposure_contribution": nq.exposure_contribution,
-            "pga_g": nq.pga_g,
-            "mmi": nq.mmi,
-        },
-    }
+def _iter_features(results: list[CountryRiskResult]) -> Iterator[dict[str, Any]]:
+    """Yield every feature for *results* in output order.
+
+    An earthquake listed under several countries is emitted once, attributed
+    to the first country it appears in.
+    """
+    seen_quakes: set[str] = set()
+    for result in results:
+        # Airport features, each followed by its connections
+        country_props = _country_props(result)
+        for airport in result.exposed_airports:
+            yield _make_airport_feature(airport, country_props)
+            for nq in airport.nearby_quakes:
+                yield make_connection_feature(airport, nq)
+
+        # Earthquake features, deduplicated across countries
+        for eq in result.earthquakes:
+            if eq.id in seen_quakes:
+                continue
+            seen_quakes.add(eq.id)
+            yield _make_earthquake_feature(eq, result)
 
 
 def export_geojson(
     results: list[CountryRiskResult],
-    output_path: Path,
-) -> Path:
+    output_path: OutputTarget,
+    *,
+    pretty: bool = False,
+) -> OutputTarget:
     """Export risk results as a GeoJSON FeatureCollection.
 
     Creates a FeatureCollection with three feature types:
@@ -106,35 +121,59 @@ def export_geojson(
     - "connection": Lines linking airports to their nearby earthquakes
 
     GeoJSON coordinates are [longitude, latitude] per spec.
+
+    Features are serialized compactly and written one at a time (one per
+    line) rather than building the whole collection in memory first.
+    Pass ``pretty=True`` for an indented document, e.g. when debugging.
     """
-    features: list[dict[str, Any]] = []
-    total_quakes = 0
+    metadata = {
+        "generated": datetime.now(tz=timezone.utc).isoformat(),
+        "source": "seismic-risk",
+        "country_count": len(results),
+        "airport_count": sum(len(r.exposed_airports) for r in results),
+        "earthquake_count": len({eq.id for r in results for eq in r.earthquakes}),
+    }
 
-    for result in results:
-        # Add airport features and their connections
-        for airport in result.exposed_airports:
-            features.append(_make_airport_feature(airport, result))
-            for nq in airport.nearby_quakes:
-                features.append(_make_connection_feature(airport, nq))
+    if pretty:
+        collection = {
+            "type": "FeatureCollection",
+            "metadata": metadata,
+            "features": list(_iter_features(results)),
+        }
+        with open_output(output_path) as f:
+            json.dump(collection, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        return output_path
+
+    with open_output(output_path) as f:
+        f.write('{"type":"FeatureCollection","metadata":')
+        f.write(_encode(metadata))
+        f.write(',"features":[')
+
+        sep = "\n"
+        for feature in _iter_features(results):
+            f.write(sep)
+            f.write(_encode(feature))
+            sep = ",\n"
+
+        f.write("\n]}\n")
+
+    return output_path
 
-        # Add all earthquake features (deduplicated within each country)
-        for eq in result.earthquakes:
-            features.append(_make_earthquake_feature(eq, result))
-            total_quakes += 1
-
-    geojson = {
-        "type": "FeatureCollection",
-        "metadata": {
-            "generated": datetime.now(tz=timezone.utc).isoformat(),
-            "source": "seismic-risk",
-            "country_count": len(results),
-            "airport_count": sum(len(r.exposed_airports) for r in results),
-            "earthquake_count": total_quakes,
-        },
-        "features": features,
-    }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=2, ensure_ascii=False)
+def export_geojson_seq(
+    results: list[CountryRiskResult],
+    output_path: OutputTarget,
+) -> OutputTarget:
+    """Export risk results as newline-delimited GeoJSON (``.geojsonl``).
+
+    Writes the same features as :func:`export_geojson`, one Feature object
+    per line with no enclosing FeatureCollection, so consumers can stream
+    or split the file by line (ogr2ogr ``GeoJSONSeq``, tippecanoe).
+    """
+    with open_output(output_path) as f:
+        for feature in _iter_features(results):
+            f.write(_encode(feature))
+            f.write("\n")
 
     return output_path
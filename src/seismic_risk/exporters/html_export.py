@@ -2,101 +2,228 @@
 
 from __future__ import annotations
 
+import gzip
+import heapq
 import json
+import os
+import re
+import shutil
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from operator import attrgetter
+from typing import IO, Any
 
 from seismic_risk.data.airport_movements import AIRPORT_MOVEMENTS, DEFAULT_MOVEMENTS
-from seismic_risk.geo import felt_radius_km
-from seismic_risk.history import TrendSummary
-from seismic_risk.models import CountryRiskResult
+from seismic_risk.exporters._features import make_connection_feature, utc_day
+from seismic_risk.exporters._output import OutputTarget, open_output
+from seismic_risk.history import AirportTrend, CountryTrend, TrendSummary
+from seismic_risk.models import CountryRiskResult, Earthquake, ExposedAirport
 
+# Compact encoder for the inline data blocks: no whitespace after ',' or ':'
+# and built once rather than per json.dumps() call.
+_encode_compact = json.JSONEncoder(separators=(",", ":")).encode
 
-def _build_geojson_data(results: list[CountryRiskResult]) -> dict[str, Any]:
-    """Build GeoJSON data structure for embedding in HTML."""
-    features: list[dict[str, Any]] = []
 
+def _js_literal(data: Any) -> str:
+    """Serialize *data* as JSON that is safe to inline in a <script> block."""
+    return _encode_compact(data).replace("</", "<\\/")
+
+
+_movements_for = AIRPORT_MOVEMENTS.get
+
+
+def _make_airport_feature(
+    airport: ExposedAirport,
+    country_props: dict[str, Any],
+) -> dict[str, Any]:
+    """Create an airport marker feature; *country_props* is shared per country."""
+    properties = {
+        "name": airport.name,
+        "iata_code": airport.iata_code,
+        "municipality": airport.municipality,
+        "closest_quake_km": airport.closest_quake_distance_km,
+        "exposure_score": airport.exposure_score,
+        "nearby_quake_count": airport.nearby_quake_count,
+        "aircraft_movements_k": _movements_for(airport.iata_code, DEFAULT_MOVEMENTS),
+        "max_pga_g": max(
+            (nq.pga_g for nq in airport.nearby_quakes if nq.pga_g is not None),
+            default=None,
+        ),
+    }
+    properties.update(country_props)
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [airport.longitude, airport.latitude],
+        },
+        "properties": properties,
+    }
+
+
+def _make_earthquake_feature(earthquake: Earthquake, country: str) -> dict[str, Any]:
+    """Create an earthquake circle feature."""
+    date_str = utc_day(earthquake.time_ms)
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [earthquake.longitude, earthquake.latitude],
+        },
+        "properties": {
+            "earthquake_id": earthquake.id,
+            "magnitude": earthquake.magnitude,
+            "depth_km": earthquake.depth_km,
+            "felt_radius_km": earthquake.felt_radius_km,
+            "date": date_str,
+            "place": earthquake.place,
+            "country": country,
+        },
+    }
+
+
+def _iter_airport_features(results: list[CountryRiskResult]) -> Iterator[dict[str, Any]]:
+    """Yield airport marker features, country by country."""
     for result in results:
-        # Add airport features
+        country_props = {
+            "country": result.country,
+            "iso_alpha3": result.iso_alpha3,
+            "country_risk_score": result.seismic_hub_risk_score,
+            "pager_alert": result.highest_pager_alert,
+        }
         for airport in result.exposed_airports:
-            pga_vals = [nq.pga_g for nq in airport.nearby_quakes if nq.pga_g is not None]
-            features.append({
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [airport.longitude, airport.latitude],
-                },
-                "properties": {
-                    "feature_type": "airport",
-                    "name": airport.name,
-                    "iata_code": airport.iata_code,
-                    "municipality": airport.municipality,
-                    "country": result.country,
-                    "iso_alpha3": result.iso_alpha3,
-                    "closest_quake_km": airport.closest_quake_distance_km,
-                    "exposure_score": airport.exposure_score,
-                    "nearby_quake_count": len(airport.nearby_quakes),
-                    "country_risk_score": result.seismic_hub_risk_score,
-                    "pager_alert": result.highest_pager_alert,
-                    "aircraft_movements_k": AIRPORT_MOVEMENTS.get(
-                        airport.iata_code, DEFAULT_MOVEMENTS
-                    ),
-                    "max_pga_g": max(pga_vals) if pga_vals else None,
-                },
-            })
+            yield _make_airport_feature(airport, country_props)
+
+
+def _iter_earthquake_features(results: list[CountryRiskResult]) -> Iterator[dict[str, Any]]:
+    """Yield earthquake circle features, country by country."""
+    for result in results:
+        for eq in result.earthquakes:
+            yield _make_earthquake_feature(eq, result.country)
+
 
-            # Add connection lines from airport to each nearby quake
+def _iter_connection_features(results: list[CountryRiskResult]) -> Iterator[dict[str, Any]]:
+    """Yield airport-to-earthquake connection lines."""
+    for result in results:
+        for airport in result.exposed_airports:
             for nq in airport.nearby_quakes:
-                features.append({
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [airport.longitude, airport.latitude],
-                            [nq.longitude, nq.latitude],
-                        ],
-                    },
-                    "properties": {
-                        "feature_type": "connection",
-                        "airport_iata": airport.iata_code,
-                        "earthquake_id": nq.earthquake_id,
-                        "distance_km": nq.distance_km,
-                        "exposure_contribution": nq.exposure_contribution,
-                        "pga_g": nq.pga_g,
-                        "mmi": nq.mmi,
-                    },
-                })
-
-        # Add all earthquake features
+                yield make_connection_feature(airport, nq, tagged=False)
+
+
+def _iter_linked_earthquake_features(
+    results: list[CountryRiskResult],
+) -> Iterator[dict[str, Any]]:
+    """Yield only the earthquake features connected to an exposed airport."""
+    for result in results:
+        linked = {
+            nq.earthquake_id for airport in result.exposed_airports for nq in airport.nearby_quakes
+        }
         for eq in result.earthquakes:
-            date_str = datetime.fromtimestamp(
-                eq.time_ms / 1000, tz=timezone.utc
-            ).strftime("%Y-%m-%d")
-            features.append({
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [eq.longitude, eq.latitude],
-                },
-                "properties": {
-                    "feature_type": "earthquake",
-                    "earthquake_id": eq.id,
-                    "magnitude": eq.magnitude,
-                    "depth_km": eq.depth_km,
-                    "felt_radius_km": felt_radius_km(eq.magnitude, eq.depth_km),
-                    "date": date_str,
-                    "place": eq.place,
-                    "country": result.country,
-                },
-            })
+            if eq.id in linked:
+                yield _make_earthquake_feature(eq, result.country)
+
+
+def _iter_no_features(results: list[CountryRiskResult]) -> Iterator[dict[str, Any]]:
+    """Yield nothing; stands in for a layer left out of the page."""
+    return iter(())
+
+
+_FeatureIter = Callable[[list[CountryRiskResult]], Iterator[dict[str, Any]]]
 
+
+def _feature_groups(
+    *, include_connections: bool = True, include_all_quakes: bool = True
+) -> dict[str, _FeatureIter]:
+    """Select the feature iterator for each embedded map layer.
+
+    Features are embedded as one list per layer, so the page needs no
+    per-feature type tag to sort them.  Excluded layers get an empty list.
+    Without the full quake layer only quakes linked to an airport are
+    embedded, and without connections nothing links them, so none are.
+    """
+    if include_all_quakes:
+        quakes: _FeatureIter = _iter_earthquake_features
+    elif include_connections:
+        quakes = _iter_linked_earthquake_features
+    else:
+        quakes = _iter_no_features
     return {
-        "type": "FeatureCollection",
-        "features": features,
+        "airports": _iter_airport_features,
+        "quakes": quakes,
+        "connections": _iter_connection_features if include_connections else _iter_no_features,
     }
 
 
+def _strip_nulls(feature: dict[str, Any]) -> dict[str, Any]:
+    """Drop ``None``-valued properties in place to shrink the inline payload.
+
+    The map script treats a missing property the same as ``null``.
+    """
+    properties = feature["properties"]
+    for key in [k for k, v in properties.items() if v is None]:
+        del properties[key]
+    return feature
+
+
+def _build_summary_data(
+    results: list[CountryRiskResult],
+    *,
+    include_connections: bool = True,
+    include_all_quakes: bool = True,
+) -> dict[str, Any]:
+    """Precompute the page's dataset-wide figures for JS embedding.
+
+    The top-five list and the colour/opacity scale maxima depend only on
+    the data, so they are computed here once instead of on every page load.
+    Both maxima are floored at 1, as the map script expects.  ``layers``
+    tells the page which optional overlays were embedded, and
+    ``quake_count`` counts every quake in the results, whether or not its
+    feature was embedded.
+    """
+    airports = [a for r in results for a in r.exposed_airports]
+    top = heapq.nlargest(5, airports, key=attrgetter("exposure_score"))
+    return {
+        "top_airports": [
+            {"name": a.name, "iata_code": a.iata_code, "exposure_score": a.exposure_score}
+            for a in top
+        ],
+        "max_score": max([1.0, *(a.exposure_score for a in airports)]),
+        "max_contrib": max(
+            [1.0, *(nq.exposure_contribution for a in airports for nq in a.nearby_quakes)]
+        ),
+        "quake_count": sum(len(r.earthquakes) for r in results),
+        "layers": {"connections": include_connections, "all_quakes": include_all_quakes},
+    }
+
+
+def _write_geojson_data(
+    f: IO[str],
+    results: list[CountryRiskResult],
+    *,
+    include_connections: bool = True,
+    include_all_quakes: bool = True,
+) -> None:
+    """Stream the map data for embedding in HTML to *f*.
+
+    The document is one feature list per layer.  Features are serialized
+    one at a time, so the full feature list and its JSON text never have
+    to exist in memory together.
+    """
+    groups = _feature_groups(
+        include_connections=include_connections, include_all_quakes=include_all_quakes
+    )
+    opening = "{"
+    for name, iter_features in groups.items():
+        f.write(f'{opening}"{name}":[')
+        sep = ""
+        for feature in iter_features(results):
+            f.write(sep)
+            f.write(_js_literal(_strip_nulls(feature)))
+            sep = ","
+        opening = "],"
+    f.write("]}")
+
+
 # HTML template with placeholders that won't conflict with CSS/JS braces
 _HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -117,13 +244,6 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                 'Segoe UI', Roboto, sans-serif;
         }
         #map { height: 100vh; width: 100%; }
-        .airport-marker {
-            background: none !important;
-            border: none !important;
-        }
-        .airport-selected {
-            filter: drop-shadow(0 0 6px rgba(0,100,255,0.8));
-        }
         .sidebar {
             position: absolute;
             top: 10px;
@@ -367,29 +487,16 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
     <script>
         var data = __GEOJSON_DATA__;
         var trendData = __TREND_DATA__;
+        var summary = __SUMMARY_DATA__;
 
-        // Categorize features
-        var airports = data.features.filter(
-            function(f) {
-                return f.properties.feature_type === 'airport';
-            }
-        );
-        var quakes = data.features.filter(
-            function(f) {
-                return f.properties.feature_type === 'earthquake';
-            }
-        );
-        var connections = data.features.filter(
-            function(f) {
-                return f.properties.feature_type === 'connection';
-            }
-        );
+        // Features arrive already grouped by layer
+        var airports = data.airports;
+        var quakes = data.quakes;
+        var connections = data.connections;
         var countries = {};
         airports.forEach(function(f) {
             countries[f.properties.country] = true;
         });
-
-        // Build set of quake IDs that appear in connections
         var connectedQuakeIds = {};
         connections.forEach(function(f) {
             connectedQuakeIds[f.properties.earthquake_id] = true;
@@ -403,17 +510,11 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
         document.getElementById('airport-count').textContent =
             airports.length;
         document.getElementById('quake-count').textContent =
-            quakes.length;
+            summary.quake_count;
 
-        // Top 5 most exposed airports
-        var sorted = airports.slice().sort(function(a, b) {
-            return b.properties.exposure_score
-                - a.properties.exposure_score;
-        });
-        var top5 = sorted.slice(0, 5);
+        // Top 5 most exposed airports (ranked at export time)
         var listEl = document.getElementById('top-airports-list');
-        top5.forEach(function(f, i) {
-            var p = f.properties;
+        summary.top_airports.forEach(function(p, i) {
             var item = document.createElement('div');
             item.className = 'top-airport-item';
             var nm = p.name.length > 22
@@ -506,7 +607,11 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
         }
 
         // Initialize map
-        var map = L.map('map').setView([20, 0], 2);
+        // Every vector layer shares one canvas, so a click is hit-tested
+        // once against airports, quakes and connections together
+        var map = L.map('map', {
+            renderer: L.canvas({ padding: 0.5 }),
+        }).setView([20, 0], 2);
         L.tileLayer(
             'https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png',
             {
@@ -517,15 +622,21 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             }
         ).addTo(map);
 
+        // Colour ramps are sampled once into 256-entry tables, so styling
+        // a feature is a lookup rather than per-channel arithmetic
+        function buildRamp(colorAt) {
+            var lut = new Array(256);
+            for (var i = 0; i < 256; i++) lut[i] = colorAt(i / 255);
+            return lut;
+        }
+        function rampIndex(t) {
+            return Math.round(Math.min(Math.max(t, 0), 1) * 255);
+        }
+
         // Exposure color: green -> yellow -> red
-        var maxScore = 1;
-        airports.forEach(function(f) {
-            if (f.properties.exposure_score > maxScore)
-                maxScore = f.properties.exposure_score;
-        });
+        var maxScore = summary.max_score;
 
-        function exposureColor(score) {
-            var t = Math.min(score / maxScore, 1);
+        var exposureRamp = buildRamp(function(t) {
             var r, g, b;
             if (t < 0.5) {
                 var s = t * 2;
@@ -539,6 +650,9 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                 b = Math.round(7 + (69 - 7) * s2);
             }
             return 'rgb(' + r + ',' + g + ',' + b + ')';
+        });
+        function exposureColor(score) {
+            return exposureRamp[rampIndex(score / maxScore)];
         }
 
         // Airport size by movement volume (3 tiers, thousands)
@@ -548,22 +662,29 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             return 9;
         }
 
-        // Diamond SVG for airport markers
-        function airportSVG(color, size) {
-            var h = size / 2;
-            var pts = h+',0 '+size+','+h+' '+h+','+size+' 0,'+h;
-            return '<svg width="' + size + '" height="' + size
-                + '"><polygon points="' + pts + '" fill="' + color
-                + '" stroke="#333" stroke-width="1.5"'
-                + ' fill-opacity="0.85"/></svg>';
-        }
+        // Diamond airport markers, drawn on the shared canvas instead of
+        // one SVG DOM node per airport
+        var DiamondMarker = L.CircleMarker.extend({
+            _updatePath: function() {
+                var renderer = this._renderer;
+                if (!renderer._drawing || this._empty()) return;
+                var pt = this._point;
+                var r = this._radius;
+                var ctx = renderer._ctx;
+                ctx.beginPath();
+                ctx.moveTo(pt.x, pt.y - r);
+                ctx.lineTo(pt.x + r, pt.y);
+                ctx.lineTo(pt.x, pt.y + r);
+                ctx.lineTo(pt.x - r, pt.y);
+                ctx.closePath();
+                renderer._fillStroke(ctx, this);
+            },
+        });
+        var AIRPORT_STROKE = { color: '#333', weight: 1.5 };
+        var AIRPORT_SELECTED_STROKE = { color: '#2563eb', weight: 3 };
 
         // Connection layer (OFF by default)
-        var maxContrib = 1;
-        connections.forEach(function(f) {
-            if (f.properties.exposure_contribution > maxContrib)
-                maxContrib = f.properties.exposure_contribution;
-        });
+        var maxContrib = summary.max_contrib;
 
         var connectionLayer = L.geoJSON(
             { type: 'FeatureCollection', features: connections },
@@ -581,13 +702,26 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             }
         );
 
+        // Index layers once so a click only touches its own features
+        function indexLayers(layerGroup, key) {
+            var index = {};
+            layerGroup.eachLayer(function(layer) {
+                var k = layer.feature.properties[key];
+                (index[k] = index[k] || []).push(layer);
+            });
+            return index;
+        }
+        var connectionsByIata = indexLayers(connectionLayer, 'airport_iata');
+
         // Earthquake color by magnitude (amber -> dark red)
-        function quakeColor(mag) {
-            var t = Math.min(Math.max((mag - 3) / 5, 0), 1);
+        var quakeRamp = buildRamp(function(t) {
             var r = Math.round(251 + (185 - 251) * t);
             var g = Math.round(191 + (28 - 191) * t);
             var b = Math.round(36 + (28 - 36) * t);
             return 'rgb(' + r + ',' + g + ',' + b + ')';
+        });
+        function quakeColor(mag) {
+            return quakeRamp[rampIndex((mag - 3) / 5)];
         }
         function quakeOpacity(mag) {
             return 0.25 + 0.45
@@ -629,10 +763,21 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             { type: 'FeatureCollection', features: nearbyQuakes },
             { pointToLayer: quakePointToLayer, onEachFeature: quakePopup }
         );
-        var allQuakeLayer = L.geoJSON(
-            { type: 'FeatureCollection', features: quakes },
-            { pointToLayer: quakePointToLayer, onEachFeature: quakePopup }
-        );
+        var nearbyQuakesById = indexLayers(nearbyQuakeLayer, 'earthquake_id');
+
+        // The full-region layer can hold thousands of circles and is rarely
+        // shown, so its features are only materialized the first time it is
+        // added to the map
+        var allQuakeLayer = L.geoJSON(null, {
+            pointToLayer: quakePointToLayer,
+            onEachFeature: quakePopup,
+        });
+        var allQuakesById = {};
+        allQuakeLayer.once('add', function() {
+            allQuakeLayer.addData(
+                { type: 'FeatureCollection', features: quakes });
+            allQuakesById = indexLayers(allQuakeLayer, 'earthquake_id');
+        });
 
         // Airport layer (ON by default)
         var airportLayer = L.geoJSON(
@@ -642,14 +787,13 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                     var p = feature.properties;
                     var color = exposureColor(p.exposure_score);
                     var size = airportSize(p.aircraft_movements_k);
-                    var icon = L.divIcon({
-                        html: airportSVG(color, size),
-                        className: 'airport-marker',
-                        iconSize: [size, size],
-                        iconAnchor: [size / 2, size / 2],
-                        popupAnchor: [0, -size / 2],
+                    return new DiamondMarker(latlng, {
+                        radius: size / 2,
+                        fillColor: color,
+                        fillOpacity: 0.85,
+                        color: AIRPORT_STROKE.color,
+                        weight: AIRPORT_STROKE.weight,
                     });
-                    return L.marker(latlng, { icon: icon });
                 },
                 onEachFeature: function(feature, layer) {
                     var p = feature.properties;
@@ -678,7 +822,7 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                         + '<div class="popup-row">'
                         + 'Country score: '
                         + p.country_risk_score + '</div>'
-                        + (p.max_pga_g !== null
+                        + (p.max_pga_g != null
                             ? '<div class="popup-row">'
                                 + 'ShakeMap PGA: '
                                 + p.max_pga_g.toFixed(4)
@@ -747,24 +891,42 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                                 + '</div>';
                         })()
                     );
-                    layer.on('click', function() {
-                        justSelected = true;
-                        selectAirport(p.iata_code, layer);
-                    });
                 },
             }
         );
 
+        // One delegated click handler for every airport: the group
+        // receives its markers' clicks with the marker as e.layer
+        airportLayer.on('click', function(e) {
+            justSelected = true;
+            selectAirport(e.layer.feature.properties.iata_code, e.layer);
+        });
+
         // Only airports on by default
         airportLayer.addTo(map);
 
-        // Layer control (top-left, expanded)
-        L.control.layers(null, {
-            'Airports': airportLayer,
-            'Quakes near airports': nearbyQuakeLayer,
-            'All quakes in region': allQuakeLayer,
-            'Connections': connectionLayer,
-        }, { position: 'topleft', collapsed: false }).addTo(map);
+        // The canvas draws and hit-tests in insertion order, so airports
+        // are raised back to the top whenever an overlay is added or
+        // brought forward; felt-radius circles never cover them
+        function raiseAirports() {
+            airportLayer.bringToFront();
+            if (selectedMarker) selectedMarker.bringToFront();
+        }
+        [connectionLayer, nearbyQuakeLayer, allQuakeLayer].forEach(
+            function(layer) { layer.on('add', raiseAirports); });
+
+        // Layer control (top-left, expanded); layers left out at export
+        // time get no entry
+        var overlays = { 'Airports': airportLayer };
+        if (summary.layers.connections)
+            overlays['Quakes near airports'] = nearbyQuakeLayer;
+        if (summary.layers.all_quakes)
+            overlays['All quakes in region'] = allQuakeLayer;
+        if (summary.layers.connections)
+            overlays['Connections'] = connectionLayer;
+        L.control.layers(null, overlays, {
+            position: 'topleft', collapsed: false,
+        }).addTo(map);
 
         // Mutual exclusion for earthquake layers
         function syncLayerCheckbox(targetLayer, checked) {
@@ -802,6 +964,7 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
 
         // --- Click-to-highlight ---
         var selectedAirport = null;
+        var selectedMarker = null;
         var highlightedConnections = [];
         var highlightedQuakes = [];
         var autoAddedLayers = [];
@@ -812,21 +975,20 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             selectedAirport = iata;
 
             // Highlight the clicked marker
-            var el = markerLayer.getElement();
-            if (el) el.classList.add('airport-selected');
+            selectedMarker = markerLayer;
+            markerLayer.setStyle(AIRPORT_SELECTED_STROKE);
+            markerLayer.bringToFront();
 
-            // Find matching connections
-            connectionLayer.eachLayer(function(layer) {
-                if (layer.feature.properties.airport_iata === iata) {
-                    highlightedConnections.push(layer);
-                    layer.setStyle({
-                        color: '#2563eb',
-                        weight: 4,
-                        dashArray: null,
-                        opacity: 0.9,
-                    });
-                    layer.bringToFront();
-                }
+            // Highlight this airport's connections
+            (connectionsByIata[iata] || []).forEach(function(layer) {
+                highlightedConnections.push(layer);
+                layer.setStyle({
+                    color: '#2563eb',
+                    weight: 4,
+                    dashArray: null,
+                    opacity: 0.9,
+                });
+                layer.bringToFront();
             });
 
             // Collect connected earthquake IDs
@@ -848,10 +1010,9 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
             }
 
             // Highlight matching earthquakes
-            function highlightQuakeLayer(qLayer) {
-                qLayer.eachLayer(function(layer) {
-                    var qid = layer.feature.properties.earthquake_id;
-                    if (linkedQuakeIds[qid]) {
+            function highlightQuakeLayer(quakesById) {
+                Object.keys(linkedQuakeIds).forEach(function(qid) {
+                    (quakesById[qid] || []).forEach(function(layer) {
                         layer._origStyle = {
                             radius: layer.getRadius(),
                             fillColor: layer.options.fillColor,
@@ -869,24 +1030,23 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
                         layer.setRadius(
                             layer.getRadius() * 1.3);
                         layer.bringToFront();
-                    }
+                    });
                 });
             }
 
             if (map.hasLayer(nearbyQuakeLayer))
-                highlightQuakeLayer(nearbyQuakeLayer);
+                highlightQuakeLayer(nearbyQuakesById);
             if (map.hasLayer(allQuakeLayer))
-                highlightQuakeLayer(allQuakeLayer);
+                highlightQuakeLayer(allQuakesById);
+            raiseAirports();
         }
 
         function clearSelection() {
             if (!selectedAirport) return;
 
             // Remove airport highlight
-            airportLayer.eachLayer(function(layer) {
-                var el = layer.getElement();
-                if (el) el.classList.remove('airport-selected');
-            });
+            if (selectedMarker) selectedMarker.setStyle(AIRPORT_STROKE);
+            selectedMarker = null;
 
             // Reset connection styles
             highlightedConnections.forEach(function(layer) {
@@ -929,70 +1089,102 @@ _HTML_TEMPLATE = """<!DOCTYPE html>
 </html>"""
 
 
+def _trend_entry(trend: CountryTrend | AirportTrend) -> dict[str, Any]:
+    """Pack the trend fields the page reads (sparkline, badge, tracked days)."""
+    return {
+        "scores": trend.scores,
+        "delta": trend.score_delta,
+        "direction": trend.trend_direction,
+        "days_tracked": trend.days_tracked,
+    }
+
+
 def _build_trend_data(trends: TrendSummary) -> dict[str, Any]:
-    """Convert TrendSummary to a compact dict for JS embedding."""
+    """Convert TrendSummary to a compact dict for JS embedding.
+
+    Only fields the map script uses are embedded; per-snapshot dates and
+    the current/previous scores would otherwise be repeated for every
+    country and airport.
+    """
     return {
         "date": trends.date,
         "history_days": trends.history_days,
         "history_start": trends.history_start,
         "countries": {
-            iso3: {
-                "scores": ct.scores,
-                "dates": ct.dates,
-                "current": ct.current_score,
-                "previous": ct.previous_score,
-                "delta": ct.score_delta,
-                "direction": ct.trend_direction,
-                "is_new": ct.is_new,
-                "days_tracked": ct.days_tracked,
-            }
+            iso3: _trend_entry(ct)
             for iso3, ct in trends.country_trends.items()
             if not ct.is_gone
         },
         "airports": {
-            iata: {
-                "scores": at.scores,
-                "dates": at.dates,
-                "current": at.current_score,
-                "previous": at.previous_score,
-                "delta": at.score_delta,
-                "direction": at.trend_direction,
-                "is_new": at.is_new,
-                "days_tracked": at.days_tracked,
-            }
+            iata: _trend_entry(at)
             for iata, at in trends.airport_trends.items()
             if not at.is_gone
         },
     }
 
 
+# Template text split around its placeholders once at import, so rendering
+# writes the pieces in order instead of copying the whole page per replace.
+_HTML_PARTS = re.split(
+    r"(__GEOJSON_DATA__|__TREND_DATA__|__SUMMARY_DATA__|__GENERATED_TIME__)", _HTML_TEMPLATE
+)
+
+
 def export_html(
     results: list[CountryRiskResult],
-    output_path: Path,
+    output_path: OutputTarget,
     *,
     trends: TrendSummary | None = None,
-) -> Path:
-    """Export risk results as a standalone HTML file with Leaflet.js map."""
-    geojson_data = _build_geojson_data(results)
+    compress: bool = False,
+    include_connections: bool = True,
+    include_all_quakes: bool = True,
+) -> OutputTarget:
+    """Export risk results as a standalone HTML file with Leaflet.js map.
+
+    With ``compress=True`` a gzip copy is also written next to the file
+    (``map.html`` -> ``map.html.gz``) for static servers that can serve
+    pre-compressed content.  Requires *output_path* to be a path.
+
+    ``include_connections=False`` leaves out the airport-to-quake lines
+    and the "Quakes near airports" layer built from them;
+    ``include_all_quakes=False`` leaves out quakes not linked to any
+    airport.  Both shrink the page for large regions.
+    """
+    html_path: str | None = None
+    if compress:
+        if not isinstance(output_path, (str, os.PathLike)):
+            raise ValueError("compress=True requires a file path, not a stream")
+        html_path = os.fspath(output_path)
+
     generated_time = datetime.now(tz=timezone.utc).strftime(
         "%Y-%m-%d %H:%M UTC"
     )
 
+    layers = {
+        "include_connections": include_connections,
+        "include_all_quakes": include_all_quakes,
+    }
     trend_json = "null"
     if trends is not None:
-        trend_json = json.dumps(
-            _build_trend_data(trends)
-        ).replace("</", "<\\/")
-
-    html_content = _HTML_TEMPLATE.replace(
-        "__GEOJSON_DATA__", json.dumps(geojson_data).replace("</", "<\\/")
-    ).replace(
-        "__TREND_DATA__", trend_json
-    ).replace(
-        "__GENERATED_TIME__", generated_time
-    )
+        trend_json = _js_literal(_build_trend_data(trends))
+
+    values = {
+        "__GENERATED_TIME__": generated_time,
+        "__TREND_DATA__": trend_json,
+        "__SUMMARY_DATA__": _js_literal(_build_summary_data(results, **layers)),
+    }
+    with open_output(output_path) as f:
+        for part in _HTML_PARTS:
+            if part == "__GEOJSON_DATA__":
+                _write_geojson_data(f, results, **layers)
+            else:
+                f.write(values.get(part, part))
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    if html_path is not None:
+        with (
+            open(html_path, "rb") as src,
+            gzip.open(f"{html_path}.gz", "wb", compresslevel=6) as dst,
+        ):
+            shutil.copyfileobj(src, dst)
 
     return output_path
@@ -3,19 +3,38 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
-from pathlib import Path
+from dataclasses import fields, is_dataclass
+from typing import Any
 
+from seismic_risk.exporters._output import OutputTarget, open_output
 from seismic_risk.models import CountryRiskResult
 
 
+def json_default(obj: Any) -> Any:
+    """``default=`` hook for ``json.dumps`` that encodes dataclasses by field.
+
+    Nested dataclasses are expanded one level at a time, without the deep
+    copy ``asdict`` makes.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def export_json(
     results: list[CountryRiskResult],
-    output_path: Path,
+    output_path: OutputTarget,
     indent: int = 2,
-) -> Path:
-    """Export risk results to a JSON file."""
-    data = [asdict(r) for r in results]
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+) -> OutputTarget:
+    """Export risk results to a JSON file or text stream.
+
+    The dataclasses are encoded directly via ``json_default``, one level
+    at a time, instead of first deep-copying the tree with ``asdict``.
+    """
+    # One-shot dumps() instead of dump(): dump() always takes the pure-Python
+    # encoder and issues a write per token, dumps() can use the C encoder
+    # (when indent is None) and hands the file a single string.
+    text = json.dumps(results, default=json_default, indent=indent, ensure_ascii=False)
+    with open_output(output_path) as f:
+        f.write(text)
     return output_path
@@ -2,43 +2,54 @@
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Mapping
 from datetime import datetime, timezone
-from pathlib import Path
+from operator import attrgetter
 
-from seismic_risk.history import TrendSummary
+from seismic_risk.exporters._output import OutputTarget, open_output
+from seismic_risk.history import AirportTrend, CountryTrend, TrendSummary
 from seismic_risk.models import CountryRiskResult
 
+# Table row templates, filled with one str.format call per row.  Optional
+# columns (trend, PGA) are passed in pre-rendered with their leading
+# " | " separator, or as "" when the column is absent.
+_COUNTRY_ROW = "| {} | {} | {} | {:.1f}{} | {:.1f} | {} | {} | {} | {} | {} | {} |"
+_AIRPORT_ROW = "| {} | {} | {} | {} | {:.1f}{}{} | {} | {} |"
+
+_EXPOSURE_KEY = attrgetter("exposure_score")
 
-def _trend_cell(iso3: str, trends: TrendSummary) -> str:
-    """Return a trend indicator string for the given country."""
-    ct = trends.country_trends.get(iso3)
-    if ct is None or ct.is_new:
-        return "NEW"
-    if ct.score_delta > 0.5:
-        return f"+{ct.score_delta:.1f}"
-    if ct.score_delta < -0.5:
-        return f"{ct.score_delta:.1f}"
-    return "~"
 
+def _abs_delta(trend: CountryTrend | AirportTrend) -> float:
+    """Sort key for the top-movers lists: size of the score change."""
+    return abs(trend.score_delta)
 
-def _airport_trend_cell(iata: str, trends: TrendSummary) -> str:
-    """Return a trend indicator string for the given airport."""
-    at = trends.airport_trends.get(iata)
-    if at is None or at.is_new:
+
+def _trend_cell(trend: CountryTrend | AirportTrend) -> str:
+    """Return a trend indicator string for one country or airport trend."""
+    if trend.is_new:
         return "NEW"
-    if at.score_delta > 0.5:
-        return f"+{at.score_delta:.1f}"
-    if at.score_delta < -0.5:
-        return f"{at.score_delta:.1f}"
+    if trend.score_delta > 0.5:
+        return f"+{trend.score_delta:.1f}"
+    if trend.score_delta < -0.5:
+        return f"{trend.score_delta:.1f}"
     return "~"
 
 
+def _trend_cells(trends: Mapping[str, CountryTrend] | Mapping[str, AirportTrend]) -> dict[str, str]:
+    """Render the trend cell for every tracked key up front.
+
+    Keys without a trend entry are reported as "NEW" by the caller.
+    """
+    return {key: _trend_cell(trend) for key, trend in trends.items()}
+
+
 def export_markdown(
     results: list[CountryRiskResult],
-    output_path: Path,
+    output_path: OutputTarget,
     *,
     trends: TrendSummary | None = None,
-) -> Path:
+) -> OutputTarget:
     """Export risk results as Markdown with country summary and airport detail tables."""
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     lines: list[str] = [
@@ -70,14 +81,14 @@ def export_markdown(
             ]
             lines.append(f"**Dropped off**: {', '.join(names)}")
 
-        movers = sorted(
-            [
+        movers = heapq.nlargest(
+            5,
+            (
                 ct for ct in trends.country_trends.values()
                 if not ct.is_gone and not ct.is_new
-            ],
-            key=lambda ct: abs(ct.score_delta),
-            reverse=True,
-        )[:5]
+            ),
+            key=_abs_delta,
+        )
         if movers:
             lines.extend(["", "**Top score changes**:", ""])
             for ct in movers:
@@ -88,14 +99,14 @@ def export_markdown(
                 )
 
         if trends.airport_trends:
-            airport_movers = sorted(
-                [
+            airport_movers = heapq.nlargest(
+                5,
+                (
                     at for at in trends.airport_trends.values()
                     if not at.is_gone and not at.is_new
-                ],
-                key=lambda at: abs(at.score_delta),
-                reverse=True,
-            )[:5]
+                ),
+                key=_abs_delta,
+            )
             if airport_movers:
                 lines.extend(["", "**Top airport exposure changes**:", ""])
                 for at in airport_movers:
@@ -129,43 +140,49 @@ def export_markdown(
             "|---------:|:------|:--------|------------:|",
         ])
 
+    trend_cells = _trend_cells(trends.country_trends) if trends is not None else None
+    append = lines.append
     for r in results:
         strongest = r.strongest_earthquake
         strongest_str = (
             f"M{strongest.magnitude} ({strongest.date})" if strongest else "-"
         )
-        if trends is not None:
-            trend_str = _trend_cell(r.iso_alpha3, trends)
-            lines.append(
-                f"| {r.country} | {r.iso_alpha3} | {r.region}"
-                f" | {r.seismic_hub_risk_score:.1f}"
-                f" | {trend_str}"
-                f" | {r.avg_magnitude:.1f} | {strongest_str}"
-                f" | {r.earthquake_count} | {len(r.exposed_airports)}"
-                f" | {r.highest_pager_alert or '-'}"
-                f" | {'Yes' if r.tsunami_warning_issued else 'No'}"
-                f" | {r.significant_events_count} |"
-            )
-        else:
-            lines.append(
-                f"| {r.country} | {r.iso_alpha3} | {r.region}"
-                f" | {r.seismic_hub_risk_score:.1f}"
-                f" | {r.avg_magnitude:.1f} | {strongest_str}"
-                f" | {r.earthquake_count} | {len(r.exposed_airports)}"
-                f" | {r.highest_pager_alert or '-'}"
-                f" | {'Yes' if r.tsunami_warning_issued else 'No'}"
-                f" | {r.significant_events_count} |"
-            )
+        trend_str = (
+            f" | {trend_cells.get(r.iso_alpha3, 'NEW')}" if trend_cells is not None else ""
+        )
+        append(_COUNTRY_ROW.format(
+            r.country,
+            r.iso_alpha3,
+            r.region,
+            r.seismic_hub_risk_score,
+            trend_str,
+            r.avg_magnitude,
+            strongest_str,
+            r.earthquake_count,
+            len(r.exposed_airports),
+            r.highest_pager_alert or "-",
+            "Yes" if r.tsunami_warning_issued else "No",
+            r.significant_events_count,
+        ))
 
     # -- Airport Details table --
-    # Check if any airport has ShakeMap PGA data
-    has_pga = any(
-        nq.pga_g is not None
+    # Max ShakeMap PGA per airport (by identity) in one pass; the PGA
+    # column is shown only if any airport has one
+    max_pga: dict[int, float | None] = {
+        id(ap): max(
+            (nq.pga_g for nq in ap.nearby_quakes if nq.pga_g is not None),
+            default=None,
+        )
         for r in results
         for ap in r.exposed_airports
-        for nq in ap.nearby_quakes
+    }
+    has_pga = any(pga is not None for pga in max_pga.values())
+    airport_cells = (
+        _trend_cells(trends.airport_trends)
+        if trends is not None and trends.airport_trends
+        else None
     )
-    has_airport_trends = trends is not None and bool(trends.airport_trends)
+    has_airport_trends = airport_cells is not None
 
     # Build header parts
     header_base = "| Airport | IATA | Municipality | Country | Exposure"
@@ -188,43 +205,31 @@ def export_markdown(
     ])
 
     for r in results:
-        for airport in sorted(
-            r.exposed_airports,
-            key=lambda a: a.exposure_score,
-            reverse=True,
-        ):
+        for airport in sorted(r.exposed_airports, key=_EXPOSURE_KEY, reverse=True):
             trend_val = ""
-            if has_airport_trends:
-                assert trends is not None  # for mypy
-                trend_val = f" | {_airport_trend_cell(airport.iata_code, trends)}"
+            if airport_cells is not None:
+                trend_val = f" | {airport_cells.get(airport.iata_code, 'NEW')}"
 
+            pga_val = ""
             if has_pga:
-                pga_vals = [
-                    nq.pga_g for nq in airport.nearby_quakes if nq.pga_g is not None
-                ]
-                pga_str = f"{max(pga_vals):.4f}" if pga_vals else "-"
-                lines.append(
-                    f"| {airport.name} | {airport.iata_code}"
-                    f" | {airport.municipality} | {r.country}"
-                    f" | {airport.exposure_score:.1f}"
-                    f"{trend_val}"
-                    f" | {pga_str}"
-                    f" | {airport.closest_quake_distance_km}"
-                    f" | {len(airport.nearby_quakes)} |"
-                )
-            else:
-                lines.append(
-                    f"| {airport.name} | {airport.iata_code}"
-                    f" | {airport.municipality} | {r.country}"
-                    f" | {airport.exposure_score:.1f}"
-                    f"{trend_val}"
-                    f" | {airport.closest_quake_distance_km}"
-                    f" | {len(airport.nearby_quakes)} |"
-                )
+                pga = max_pga[id(airport)]
+                pga_val = f" | {pga:.4f}" if pga is not None else " | -"
+
+            append(_AIRPORT_ROW.format(
+                airport.name,
+                airport.iata_code,
+                airport.municipality,
+                r.country,
+                airport.exposure_score,
+                trend_val,
+                pga_val,
+                airport.closest_quake_distance_km,
+                airport.nearby_quake_count,
+            ))
 
     lines.append("")  # trailing newline
 
-    with open(output_path, "w", encoding="utf-8") as f:
+    with open_output(output_path) as f:
         f.write("\n".join(lines))
 
     return output_path
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
 
 import pandas as pd
 from requests import Session
 
-from seismic_risk.cache import AIRPORTS_TTL, cache_get, cache_put
+from seismic_risk.cache import AIRPORTS_TTL, cache_get, cache_get_stale, cache_put, cache_touch
 from seismic_risk.http import create_session
 from seismic_risk.models import Airport
 
@@ -19,6 +20,58 @@ OURAIRPORTS_CSV_URL = (
 )
 
 _CACHE_KEY = "airports.csv"
+# ETag / Last-Modified of the cached copy, for conditional re-downloads
+_VALIDATORS_KEY = "airports.csv.validators"
+
+# OurAirports ships ~18 columns; only these are used.  Skipping the rest
+# saves tokenizing and inferring dtypes for most of the file, and the
+# categorical ``type`` makes the airport-type filter an integer compare.
+_AIRPORT_FIELDS = [
+    "name",
+    "latitude_deg",
+    "longitude_deg",
+    "iso_country",
+    "municipality",
+    "iata_code",
+]
+_USECOLS = ["type", *_AIRPORT_FIELDS]
+_DTYPES = {"type": "category", "latitude_deg": "float64", "longitude_deg": "float64"}
+
+
+def _read_csv(source: str | io.BytesIO) -> pd.DataFrame:
+    """Parse the airports CSV, keeping only the columns fetch_airports needs."""
+    return pd.read_csv(source, usecols=_USECOLS, dtype=_DTYPES)
+
+
+# The cache's in-memory tier hands back the same bytes object for as long
+# as an entry stays fresh, so the frame parsed from it can be reused by
+# identity and repeat calls in one process skip read_csv entirely.
+_last_parsed: tuple[bytes, pd.DataFrame] | None = None
+
+
+def _parse_payload(data: bytes) -> pd.DataFrame:
+    """Parse CSV bytes, reusing the previous frame for the same payload."""
+    global _last_parsed
+    last = _last_parsed
+    if last is not None and last[0] is data:
+        return last[1]
+    df = _read_csv(io.BytesIO(data))
+    _last_parsed = (data, df)
+    return df
+
+
+def _conditional_headers() -> dict[str, str]:
+    """Return If-None-Match / If-Modified-Since headers for the cached CSV."""
+    raw = cache_get_stale(_VALIDATORS_KEY)
+    if raw is None:
+        return {}
+    validators = json.loads(raw)
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
 
 
 def _download_csv(
@@ -26,25 +79,43 @@ def _download_csv(
 ) -> pd.DataFrame:
     """Download CSV via session (retry-enabled) or read local path.
 
-    For HTTP URLs, checks the disk cache first (24h TTL).
+    For HTTP URLs, checks the disk cache first (24h TTL).  Once the entry
+    has expired it is revalidated with a conditional GET; a 304 reply
+    keeps the cached copy without re-downloading it.
     """
     if url.startswith(("http://", "https://")):
+        stale: bytes | None = None
+        headers: dict[str, str] = {}
         if use_cache:
             cached = cache_get(_CACHE_KEY, AIRPORTS_TTL)
             if cached is not None:
                 logger.info("Using cached airports data")
-                return pd.read_csv(io.BytesIO(cached))
-
-        resp = session.get(url, timeout=timeout)
+                return _parse_payload(cached)
+            stale = cache_get_stale(_CACHE_KEY)
+            if stale is not None:
+                headers = _conditional_headers()
+
+        resp = session.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and stale is not None:
+            logger.info("Airports data not modified; reusing cached copy")
+            cache_touch(_CACHE_KEY)
+            return _parse_payload(stale)
         resp.raise_for_status()
 
         if use_cache:
             cache_put(_CACHE_KEY, resp.content)
+            validators = {}
+            if "ETag" in resp.headers:
+                validators["etag"] = resp.headers["ETag"]
+            if "Last-Modified" in resp.headers:
+                validators["last_modified"] = resp.headers["Last-Modified"]
+            cache_put(_VALIDATORS_KEY, json.dumps(validators).encode())
+            return _parse_payload(resp.content)
 
-        return pd.read_csv(io.BytesIO(resp.content))
+        return _read_csv(io.BytesIO(resp.content))
 
     # Local file path (used in tests)
-    return pd.read_csv(url)
+    return _read_csv(url)
 
 
 def fetch_airports(
@@ -62,28 +133,33 @@ def fetch_airports(
         session = create_session()
 
     df = _download_csv(url, session, timeout, use_cache)
-    filtered = df[df["type"] == airport_type].copy()
-
+    # One combined mask, one indexing pass, and only the columns read below
+    mask = df["type"] == airport_type
     if country_codes is not None:
-        filtered = filtered[filtered["iso_country"].isin(country_codes)]
-
-    airports: list[Airport] = []
-    for _, row in filtered.iterrows():
-        iata = (
-            str(row["iata_code"])
-            if pd.notna(row["iata_code"]) and row["iata_code"] != ""
-            else "N/A"
+        mask &= df["iso_country"].isin(country_codes)
+    filtered = df.loc[mask, _AIRPORT_FIELDS]
+
+    # Pull each column out as a plain list once; per-row access through
+    # iterrows() boxes every cell into a new Series.
+    iata_codes = filtered["iata_code"].fillna("").astype(str).replace("", "N/A")
+    municipalities = filtered["municipality"].fillna("").astype(str)
+    return [
+        Airport(
+            name=name,
+            iata_code=iata,
+            latitude=latitude,
+            longitude=longitude,
+            municipality=municipality,
+            iso_country=iso_country,
+            airport_type=airport_type,
         )
-        municipality = str(row["municipality"]) if pd.notna(row["municipality"]) else ""
-        airports.append(
-            Airport(
-                name=str(row["name"]),
-                iata_code=iata,
-                latitude=float(row["latitude_deg"]),
-                longitude=float(row["longitude_deg"]),
-                municipality=municipality,
-                iso_country=str(row["iso_country"]),
-                airport_type=airport_type,
-            )
+        for name, iata, latitude, longitude, municipality, iso_country in zip(
+            filtered["name"].map(str).tolist(),
+            iata_codes.tolist(),
+            filtered["latitude_deg"].astype(float).tolist(),
+            filtered["longitude_deg"].astype(float).tolist(),
+            municipalities.tolist(),
+            filtered["iso_country"].map(str).tolist(),
+            strict=True,
         )
-    return airports
+    ]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from requests import Session
 
-from seismic_risk.cache import COUNTRIES_TTL, cache_get, cache_put
+from seismic_risk.cache import COUNTRIES_TTL, cache_get_entry, cache_put
 from seismic_risk.http import create_session
 
 logger = logging.getLogger(__name__)
@@ -15,44 +19,101 @@ logger = logging.getLogger(__name__)
 REST_COUNTRIES_BASE = "https://restcountries.com/v3.1/alpha"
 
 
+def _cache_key(cc: str) -> str:
+    """Disk cache key for one country's gzip-compressed JSON record."""
+    return f"country_{cc}.json.gz"
+
+
+def _encode_record(country_data: dict) -> bytes:
+    """Compress a record for the disk cache.
+
+    The translations and native-name blocks make records several KB of
+    highly repetitive JSON, which gzip shrinks several-fold.
+    """
+    return gzip.compress(
+        json.dumps(country_data, separators=(",", ":")).encode(), compresslevel=6
+    )
+
+
+# In-process records: {(base_url, code): (written_at, record)}, stamped with
+# the disk entry's write time so the memo expires with the disk cache
+_memo: dict[tuple[str, str], tuple[float, dict]] = {}
+_memo_lock = threading.Lock()
+
+
+def _fetch_country(session: Session, url: str, timeout: int) -> dict | None:
+    """Fetch one country record; ``None`` on a non-200 response."""
+    resp = session.get(url, timeout=timeout)
+    if resp.status_code != 200:
+        return None
+    data = resp.json()
+    country_data: dict = data[0] if isinstance(data, list) else data
+    return country_data
+
+
 def fetch_country_metadata(
     country_codes: set[str],
     timeout: int = 10,
     base_url: str = REST_COUNTRIES_BASE,
     session: Session | None = None,
     use_cache: bool = True,
+    max_workers: int = 8,
 ) -> dict[str, dict]:
     """Fetch metadata for each country code from the REST Countries API.
 
     Countries that fail to fetch are silently omitted.
-    Uses a shared session for connection pooling across sequential requests.
-    Caches individual country responses on disk (7-day TTL).
+    Cache misses are fetched concurrently on up to *max_workers* threads
+    sharing one pooled session, so total latency is roughly that of the
+    slowest request rather than the sum of all of them.
+    Caches individual country responses on disk (7-day TTL) and keeps
+    the parsed records in process, so later calls (e.g. every backfill
+    month) skip the disk read and JSON parse for codes already seen.
     """
     if session is None:
         session = create_session()
 
     result: dict[str, dict] = {}
+    misses: list[str] = []
+    now = time.time()
     for cc in sorted(country_codes):
-        cache_key = f"country_{cc}.json"
-
-        # Check cache first
         if use_cache:
-            cached = cache_get(cache_key, COUNTRIES_TTL)
+            with _memo_lock:
+                hit = _memo.get((base_url, cc))
+            if hit is not None and now - hit[0] <= COUNTRIES_TTL:
+                result[cc] = hit[1]
+                continue
+            cached = cache_get_entry(_cache_key(cc), COUNTRIES_TTL)
             if cached is not None:
                 logger.debug("Cache hit for country %s", cc)
-                result[cc] = json.loads(cached)
+                written_at, payload = cached
+                result[cc] = json.loads(gzip.decompress(payload))
+                with _memo_lock:
+                    _memo[(base_url, cc)] = (written_at, result[cc])
                 continue
+        misses.append(cc)
 
-        try:
-            resp = session.get(f"{base_url}/{cc}", timeout=timeout)
-            if resp.status_code == 200:
-                data = resp.json()
-                country_data = data[0] if isinstance(data, list) else data
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as pool:
+            futures = {
+                pool.submit(_fetch_country, session, f"{base_url}/{cc}", timeout): cc
+                for cc in misses
+            }
+            for future in as_completed(futures):
+                cc = futures[future]
+                try:
+                    country_data = future.result()
+                except Exception:
+                    logger.warning(
+                        "Failed to fetch country metadata for %s", cc, exc_info=True
+                    )
+                    continue
+                if country_data is None:
+                    continue
                 result[cc] = country_data
-
                 if use_cache:
-                    cache_put(cache_key, json.dumps(country_data).encode())
-        except Exception:
-            logger.warning("Failed to fetch country metadata for %s", cc, exc_info=True)
+                    cache_put(_cache_key(cc), _encode_record(country_data))
+                    with _memo_lock:
+                        _memo[(base_url, cc)] = (time.time(), country_data)
 
-    return result
+    # Completion order is arbitrary; keep the sorted order callers saw before
+    return {cc: result[cc] for cc in sorted(result)}
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 
 import numpy as np
 from requests import Session
@@ -32,8 +34,15 @@ class ShakeMapGrid:
     lat_spacing: float
     nlon: int
     nlat: int
-    pga: np.ndarray  # shape (nlat, nlon), values in %g
-    mmi: np.ndarray  # shape (nlat, nlon)
+    pga: np.ndarray  # float32, shape (nlat, nlon), values in %g
+    mmi: np.ndarray  # float32, shape (nlat, nlon)
+    # Reciprocal spacings so interpolation multiplies instead of divides
+    inv_lon_spacing: float = field(init=False, repr=False)
+    inv_lat_spacing: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.inv_lon_spacing = 1.0 / self.lon_spacing
+        self.inv_lat_spacing = 1.0 / self.lat_spacing
 
 
 def interpolate_pga(
@@ -49,9 +58,9 @@ def interpolate_pga(
         return None
 
     # Column index (fractional) — left to right
-    col = (lon - grid.lon_min) / grid.lon_spacing
+    col = (lon - grid.lon_min) * grid.inv_lon_spacing
     # Row index (fractional) — row 0 is lat_max, row nlat-1 is lat_min
-    row = (grid.lat_max - lat) / grid.lat_spacing
+    row = (grid.lat_max - lat) * grid.inv_lat_spacing
 
     # Clamp to valid range
     col = max(0.0, min(col, grid.nlon - 1))
@@ -67,25 +76,78 @@ def interpolate_pga(
     dc = col - c0
     dr = row - r0
 
-    # Bilinear interpolation for PGA
+    # Corner weights, shared by PGA and MMI
+    w00 = (1 - dc) * (1 - dr)
+    w01 = dc * (1 - dr)
+    w10 = (1 - dc) * dr
+    w11 = dc * dr
+
+    # Bilinear interpolation, in float64 over the float32 grid values
+    pga_at = grid.pga.item
     pga = (
-        grid.pga[r0, c0] * (1 - dc) * (1 - dr)
-        + grid.pga[r0, c1] * dc * (1 - dr)
-        + grid.pga[r1, c0] * (1 - dc) * dr
-        + grid.pga[r1, c1] * dc * dr
+        pga_at(r0, c0) * w00 + pga_at(r0, c1) * w01
+        + pga_at(r1, c0) * w10 + pga_at(r1, c1) * w11
     )
-
-    # Bilinear interpolation for MMI
+    mmi_at = grid.mmi.item
     mmi = (
-        grid.mmi[r0, c0] * (1 - dc) * (1 - dr)
-        + grid.mmi[r0, c1] * dc * (1 - dr)
-        + grid.mmi[r1, c0] * (1 - dc) * dr
-        + grid.mmi[r1, c1] * dc * dr
+        mmi_at(r0, c0) * w00 + mmi_at(r0, c1) * w01
+        + mmi_at(r1, c0) * w10 + mmi_at(r1, c1) * w11
     )
 
     return float(pga), float(mmi)
 
 
+def interpolate_pga_batch(
+    grid: ShakeMapGrid, lats: np.ndarray, lons: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`interpolate_pga` over arrays of points.
+
+    Returns ``(pga_%g, mmi)`` arrays shaped like *lats*; points outside the
+    grid bounds are NaN in both.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    inside = (
+        (lons >= grid.lon_min) & (lons <= grid.lon_max)
+        & (lats >= grid.lat_min) & (lats <= grid.lat_max)
+    )
+
+    col = np.clip((lons - grid.lon_min) * grid.inv_lon_spacing, 0.0, grid.nlon - 1)
+    row = np.clip((grid.lat_max - lats) * grid.inv_lat_spacing, 0.0, grid.nlat - 1)
+    # Out-of-bounds (or NaN) points get index 0; their result is masked below
+    col[~inside] = 0.0
+    row[~inside] = 0.0
+
+    c0 = col.astype(np.intp)
+    r0 = row.astype(np.intp)
+    c1 = np.minimum(c0 + 1, grid.nlon - 1)
+    r1 = np.minimum(r0 + 1, grid.nlat - 1)
+    dc = col - c0
+    dr = row - r0
+
+    # Same operation order as interpolate_pga so results match bit for bit
+    w00 = (1 - dc) * (1 - dr)
+    w01 = dc * (1 - dr)
+    w10 = (1 - dc) * dr
+    w11 = dc * dr
+    pga = (
+        grid.pga[r0, c0] * w00 + grid.pga[r0, c1] * w01
+        + grid.pga[r1, c0] * w10 + grid.pga[r1, c1] * w11
+    )
+    mmi = (
+        grid.mmi[r0, c0] * w00 + grid.mmi[r0, c1] * w01
+        + grid.mmi[r1, c0] * w10 + grid.mmi[r1, c1] * w11
+    )
+    pga[~inside] = np.nan
+    mmi[~inside] = np.nan
+    return pga, mmi
+
+
+def _cache_key(event_id: str) -> str:
+    """Disk cache key for one event's raw grid.xml."""
+    return f"shakemap_{event_id}.xml"
+
+
 def _fetch_event_detail(
     event_id: str, session: Session, timeout: int,
 ) -> dict | None:
@@ -150,26 +212,23 @@ def _parse_grid_xml(xml_bytes: bytes, event_id: str) -> ShakeMapGrid | None:
             logger.warning("No grid_data in %s", event_id)
             return None
 
-        lines = grid_data_el.text.strip().split("\n")
-        pga_flat: list[float] = []
-        mmi_flat: list[float] = []
-        for line in lines:
-            parts = line.strip().split()
-            if len(parts) < 4:
-                continue
-            mmi_flat.append(float(parts[2]))  # MMI at index 2
-            pga_flat.append(float(parts[3]))  # PGA at index 3
+        # Only the MMI (index 2) and PGA (index 3) columns are read.  ShakeMap
+        # publishes them to two or three decimals, so float32 loses nothing
+        # and halves the grid's memory footprint.
+        values = np.loadtxt(
+            io.StringIO(grid_data_el.text), dtype=np.float32, usecols=(2, 3), ndmin=2,
+        )
 
         expected = nlon * nlat
-        if len(pga_flat) != expected:
+        if len(values) != expected:
             logger.warning(
                 "Grid %s: expected %d points, got %d",
-                event_id, expected, len(pga_flat),
+                event_id, expected, len(values),
             )
             return None
 
-        pga = np.array(pga_flat, dtype=np.float64).reshape(nlat, nlon)
-        mmi = np.array(mmi_flat, dtype=np.float64).reshape(nlat, nlon)
+        mmi = np.ascontiguousarray(values[:, 0]).reshape(nlat, nlon)
+        pga = np.ascontiguousarray(values[:, 1]).reshape(nlat, nlon)
 
         return ShakeMapGrid(
             event_id=event_id,
@@ -189,16 +248,42 @@ def _parse_grid_xml(xml_bytes: bytes, event_id: str) -> ShakeMapGrid | None:
         return None
 
 
+def _download_grid(event_id: str, session: Session, timeout: int) -> bytes | None:
+    """Fetch event detail, then its grid.xml; ``None`` if either step fails."""
+    detail = _fetch_event_detail(event_id, session, timeout)
+    if detail is None:
+        return None
+
+    grid_url = _extract_grid_url(detail)
+    if grid_url is None:
+        logger.info("No grid.xml URL for %s", event_id)
+        return None
+
+    try:
+        resp = session.get(grid_url, timeout=timeout)
+        if resp.status_code != 200:
+            logger.warning("Grid download %s returned %d", event_id, resp.status_code)
+            return None
+        return resp.content
+    except Exception:
+        logger.warning("Failed to download grid for %s", event_id, exc_info=True)
+        return None
+
+
 def fetch_shakemap_grids(
     earthquake_ids: set[str],
     event_types: dict[str, str],
     session: Session | None = None,
     timeout: int = 60,
     use_cache: bool = True,
+    max_workers: int = 8,
 ) -> dict[str, ShakeMapGrid]:
     """Fetch ShakeMap grids for earthquakes that have ShakeMap data.
 
     Only fetches for events whose types string contains ``shakemap``.
+    Cache misses are downloaded concurrently on up to *max_workers*
+    threads sharing one pooled session; each worker makes the event
+    detail and grid.xml requests for one event back to back.
     Returns ``{event_id: ShakeMapGrid}`` for successfully fetched grids.
     """
     if session is None:
@@ -214,41 +299,32 @@ def fetch_shakemap_grids(
         return {}
 
     logger.info("Fetching ShakeMap grids for %d events", len(target_ids))
-    grids: dict[str, ShakeMapGrid] = {}
-
-    for eid in sorted(target_ids):  # sorted for deterministic order
-        cache_key = f"shakemap_{eid}.xml"
-
-        # Try cache first
-        xml_bytes: bytes | None = None
-        if use_cache:
-            xml_bytes = cache_get(cache_key, SHAKEMAP_GRID_TTL)
-
-        if xml_bytes is None:
-            # Fetch event detail → grid URL → grid data
-            detail = _fetch_event_detail(eid, session, timeout)
-            if detail is None:
-                continue
-
-            grid_url = _extract_grid_url(detail)
-            if grid_url is None:
-                logger.info("No grid.xml URL for %s", eid)
-                continue
-
-            try:
-                resp = session.get(grid_url, timeout=timeout)
-                if resp.status_code != 200:
-                    logger.warning("Grid download %s returned %d", eid, resp.status_code)
+    payloads: dict[str, bytes] = {}
+    misses: list[str] = []
+    for eid in sorted(target_ids):
+        cached = cache_get(_cache_key(eid), SHAKEMAP_GRID_TTL) if use_cache else None
+        if cached is not None:
+            payloads[eid] = cached
+        else:
+            misses.append(eid)
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as pool:
+            futures = {
+                pool.submit(_download_grid, eid, session, timeout): eid for eid in misses
+            }
+            for future in as_completed(futures):
+                eid = futures[future]
+                xml_bytes = future.result()
+                if xml_bytes is None:
                     continue
-                xml_bytes = resp.content
-            except Exception:
-                logger.warning("Failed to download grid for %s", eid, exc_info=True)
-                continue
+                payloads[eid] = xml_bytes
+                if use_cache:
+                    cache_put(_cache_key(eid), xml_bytes)
 
-            if use_cache:
-                cache_put(cache_key, xml_bytes)
-
-        grid = _parse_grid_xml(xml_bytes, eid)
+    grids: dict[str, ShakeMapGrid] = {}
+    for eid in sorted(payloads):  # sorted for deterministic order
+        grid = _parse_grid_xml(payloads[eid], eid)
         if grid is not None:
             grids[eid] = grid
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import math
+import threading
+from functools import lru_cache
 
+import numpy as np
 import reverse_geocoder as rg
 
 
@@ -17,10 +20,49 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return earth_radius_km * 2 * math.asin(math.sqrt(a))
 
 
+def haversine_batch(
+    lat1: float, lon1: float, lat2s: np.ndarray, lon2s: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distances in km from one point to arrays of points.
+
+    Vectorized :func:`haversine`; returns an array shaped like *lat2s*.
+    """
+    earth_radius_km = 6371.0
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2 = np.radians(lat2s)
+    lon2 = np.radians(lon2s)
+    a = np.sin((lat2 - lat1) / 2) ** 2
+    a += math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    distances: np.ndarray = earth_radius_km * 2 * np.arcsin(np.sqrt(a))
+    return distances
+
+
 _MMI_THRESHOLD = 5.0  # MMI V: strong shaking, infrastructure concern
 _MIN_FELT_RADIUS_KM = 5.0
 
 
+@lru_cache(maxsize=1024)
+def _solve_hypocentral_km(c: float) -> float:
+    """Solve c - 1.26*ln(R) - 0.0012*R = 0 for R by Newton's method.
+
+    *c* depends only on magnitude, and reported magnitudes take few
+    distinct values, so the solve is memoized independently of depth.
+    """
+    r = 50.0  # initial guess (km)
+    for _ in range(20):
+        ln_r = math.log(r)
+        f = c - 1.26 * ln_r - 0.0012 * r
+        f_prime = -1.26 / r - 0.0012
+        step = f / f_prime
+        r_new = r - step
+        if r_new <= 0:
+            r_new = r / 2  # safeguard
+        if abs(r_new - r) < 0.01:
+            break
+        r = r_new
+    return r
+
+
 def felt_radius_km(magnitude: float, depth_km: float) -> float:
     """Estimate the surface radius (km) where shaking reaches MMI V.
 
@@ -43,21 +85,7 @@ def felt_radius_km(magnitude: float, depth_km: float) -> float:
     if c <= 0:
         return _MIN_FELT_RADIUS_KM
 
-    # Newton's method to solve for R_hypo
-    r = 50.0  # initial guess (km)
-    for _ in range(20):
-        ln_r = math.log(r)
-        f = c - 1.26 * ln_r - 0.0012 * r
-        f_prime = -1.26 / r - 0.0012
-        step = f / f_prime
-        r_new = r - step
-        if r_new <= 0:
-            r_new = r / 2  # safeguard
-        if abs(r_new - r) < 0.01:
-            break
-        r = r_new
-
-    r_hypo = r  # hypocentral distance where MMI = V
+    r_hypo = _solve_hypocentral_km(c)  # hypocentral distance where MMI = V
 
     # Convert to surface distance
     depth = max(depth_km, 0.0)
@@ -68,8 +96,17 @@ def felt_radius_km(magnitude: float, depth_km: float) -> float:
     return max(round(d_surface, 1), _MIN_FELT_RADIUS_KM)
 
 
+# reverse_geocoder lazily builds a process-wide singleton without locking
+_GEOCODER_LOCK = threading.Lock()
+
+
 def reverse_geocode_batch(
     coords: list[tuple[float, float]],
 ) -> list[dict[str, str]]:
-    """Reverse-geocode a batch of (latitude, longitude) pairs to country codes."""
-    return rg.search(coords)  # type: ignore[no-any-return]
+    """Reverse-geocode a batch of (latitude, longitude) pairs to country codes.
+
+    Thread-safe: calls are serialized so concurrent pipeline runs do not
+    race on the geocoder's lazy initialization.
+    """
+    with _GEOCODER_LOCK:
+        return rg.search(coords)  # type: ignore[no-any-return]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import sys
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -140,7 +142,7 @@ def save_snapshot(
                         iata_code=ap.iata_code,
                         name=ap.name,
                         exposure_score=round(ap.exposure_score, 2),
-                        nearby_quake_count=len(ap.nearby_quakes),
+                        nearby_quake_count=ap.nearby_quake_count,
                         closest_quake_km=round(ap.closest_quake_distance_km, 1),
                         max_pga_g=_max_pga(ap.nearby_quakes),
                     )
@@ -151,8 +153,13 @@ def save_snapshot(
         ],
     )
 
+    # Compact separators keep the C encoder on the fast path (``indent``
+    # forces the pure-Python one) and shrink each snapshot file.
     path = history_dir / f"{snapshot_date.isoformat()}.json"
-    path.write_text(json.dumps(asdict(snapshot), indent=2), encoding="utf-8")
+    path.write_text(
+        json.dumps(asdict(snapshot), separators=(",", ":"), ensure_ascii=False),
+        encoding="utf-8",
+    )
     return path
 
 
@@ -168,23 +175,35 @@ def load_history(
     if not history_dir.is_dir():
         return []
 
-    files = sorted(history_dir.glob("*.json"))
-    files = files[-max_days:]  # keep most recent
+    with os.scandir(history_dir) as it:
+        names = sorted(
+            e.name for e in it
+            if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+        )
+    names = names[-max_days:]  # keep most recent
 
     snapshots: list[DailySnapshot] = []
-    for f in files:
+    for name in names:
+        f = history_dir / name
         try:
-            raw = json.loads(f.read_text(encoding="utf-8"))
+            raw = json.loads(f.read_bytes())
             countries = []
             for c in raw["countries"]:
-                airports_raw = c.get("airports", [])
-                airports = [AirportSnapshot(**a) for a in airports_raw]
+                # The same codes and names recur in every snapshot; interning
+                # them lets all loaded days share one copy of each string.
+                airports = []
+                for a in c.get("airports", []):
+                    a["iata_code"] = sys.intern(a["iata_code"])
+                    a["name"] = sys.intern(a["name"])
+                    airports.append(AirportSnapshot(**a))
                 country_fields = {k: v for k, v in c.items() if k != "airports"}
+                country_fields["iso_alpha3"] = sys.intern(country_fields["iso_alpha3"])
+                country_fields["country"] = sys.intern(country_fields["country"])
                 countries.append(CountrySnapshot(**country_fields, airports=airports))
             snapshots.append(
                 DailySnapshot(
                     date=raw["date"],
-                    scoring_method=raw["scoring_method"],
+                    scoring_method=sys.intern(raw["scoring_method"]),
                     countries=countries,
                 )
             )
@@ -2,20 +2,56 @@
 
 from __future__ import annotations
 
-from requests import Session
+import threading
+import time
+from typing import Any
+
+from requests import PreparedRequest, Response, Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that spaces outgoing requests at least *min_interval* apart.
+
+    The interval is enforced across all threads sharing the adapter, so a
+    pool of workers can overlap their CPU-side work while still respecting
+    an upstream rate limit.
+    """
+
+    def __init__(self, min_interval: float = 0.0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore[override]
+        if self._min_interval > 0:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._next_slot - now
+                self._next_slot = max(now, self._next_slot) + self._min_interval
+            if wait > 0:
+                time.sleep(wait)
+        return super().send(request, **kwargs)
+
+
 def create_session(
     retries: int = 3,
     backoff_factor: float = 0.5,
     status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+    pool_maxsize: int = 10,
+    min_interval: float = 0.0,
 ) -> Session:
     """Create a requests Session with exponential backoff retry.
 
     Backoff schedule (backoff_factor=0.5): 0s, 0.5s, 1s.
     Retries only on GET requests and only for the listed status codes.
+
+    *pool_maxsize* bounds the number of keep-alive connections per host;
+    raise it when the session is shared across worker threads.
+    *min_interval* (seconds) rate-limits outgoing requests across all
+    threads using the session; 0 disables throttling.
     """
     retry = Retry(
         total=retries,
@@ -24,7 +60,11 @@ def create_session(
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = _ThrottledAdapter(
+        min_interval=min_interval,
+        max_retries=retry,
+        pool_maxsize=pool_maxsize,
+    )
     session = Session()
     session.mount("https://", adapter)
     session.mount("http://", adapter)
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+
+from seismic_risk.geo import felt_radius_km
 
 
 @dataclass(frozen=True)
@@ -19,6 +22,11 @@ class Earthquake:
     country_code: str = ""
     shakemap_available: bool = False
 
+    @cached_property
+    def felt_radius_km(self) -> float:
+        """Surface radius (km) of MMI V shaking; computed once per event."""
+        return felt_radius_km(self.magnitude, self.depth_km)
+
 
 @dataclass(frozen=True)
 class SignificantEvent:
@@ -75,6 +83,11 @@ class ExposedAirport:
     nearby_quakes: list[NearbyQuake] = field(default_factory=list)
     exposure_score: float = 0.0
 
+    @property
+    def nearby_quake_count(self) -> int:
+        """Number of earthquakes within the exposure radius."""
+        return len(self.nearby_quakes)
+
 
 @dataclass
 class StrongestEarthquake:
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from collections import Counter
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 
+from requests import Session
+
+from seismic_risk.cache import AIRPORTS_TTL
 from seismic_risk.config import SeismicRiskConfig
 from seismic_risk.fetchers.airports import fetch_airports
 from seismic_risk.fetchers.countries import fetch_country_metadata
@@ -13,7 +18,12 @@ from seismic_risk.fetchers.shakemap import ShakeMapGrid, fetch_shakemap_grids
 from seismic_risk.fetchers.usgs import fetch_earthquakes, fetch_significant_earthquakes
 from seismic_risk.geo import reverse_geocode_batch
 from seismic_risk.http import create_session
-from seismic_risk.models import CountryRiskResult
+from seismic_risk.models import (
+    Airport,
+    CountryRiskResult,
+    Earthquake,
+    SignificantEvent,
+)
 from seismic_risk.scoring import (
     calculate_risk_score,
     compute_pager_context,
@@ -49,21 +59,177 @@ def _extract_country_metadata(cd: dict) -> dict:
     }
 
 
-def run_pipeline(config: SeismicRiskConfig) -> list[CountryRiskResult]:
-    """Execute the full seismic risk assessment pipeline.
+# In-process airport index: {airport_type: (built_at, {iso_country: airports})}
+_airport_index: dict[str, tuple[float, dict[str, tuple[Airport, ...]]]] = {}
+_airport_index_lock = threading.Lock()
+# One build lock per airport type, so concurrent cold lookups build once
+_airport_build_locks: dict[str, threading.Lock] = {}
 
-    Steps:
-    1. Fetch earthquakes from USGS
-    2. Reverse-geocode epicenters to country codes
-    3. Count per country, filter by minimum threshold
-    4. Fetch significant earthquakes feed
-    5. Fetch airports for qualifying countries
-    6. Fetch REST Countries metadata
-    7. Compute exposure, stats, and score per country
-    8. Sort by risk score descending
+
+def _group_by_country(airports: list[Airport]) -> dict[str, tuple[Airport, ...]]:
+    """Group *airports* into per-country tuples keyed by ISO alpha-2 code."""
+    grouped: dict[str, list[Airport]] = {}
+    for ap in airports:
+        grouped.setdefault(ap.iso_country, []).append(ap)
+    return {cc: tuple(aps) for cc, aps in grouped.items()}
+
+
+def _fresh_airport_index(airport_type: str) -> dict[str, tuple[Airport, ...]] | None:
+    """Return the cached index for *airport_type* if it is within its TTL."""
+    with _airport_index_lock:
+        hit = _airport_index.get(airport_type)
+    if hit is not None and time.time() - hit[0] <= AIRPORTS_TTL:
+        return hit[1]
+    return None
+
+
+def _airports_by_country(
+    airport_type: str,
+    session: Session,
+    use_cache: bool,
+    country_codes: set[str] | None = None,
+) -> dict[str, tuple[Airport, ...]]:
+    """Return airports of *airport_type*, grouped by ISO country.
+
+    The airport list does not depend on the earthquake window, so with
+    caching enabled the grouped index covers every country, is built once
+    per airport type and is reused by later runs in the same process (e.g.
+    every backfill month), expiring on the same TTL as the on-disk airports
+    cache.  Without caching nothing is reused, so only *country_codes* are
+    fetched and grouped.
+    """
+    if not use_cache:
+        return _group_by_country(fetch_airports(
+            airport_type=airport_type,
+            country_codes=country_codes,
+            session=session,
+            use_cache=False,
+        ))
+
+    index = _fresh_airport_index(airport_type)
+    if index is not None:
+        return index
+
+    with _airport_index_lock:
+        build_lock = _airport_build_locks.setdefault(airport_type, threading.Lock())
+    with build_lock:
+        # Another thread may have built the index while we waited
+        index = _fresh_airport_index(airport_type)
+        if index is None:
+            index = _group_by_country(
+                fetch_airports(airport_type=airport_type, session=session, use_cache=True)
+            )
+            with _airport_index_lock:
+                _airport_index[airport_type] = (time.time(), index)
+    return index
+
+
+def _score_countries(
+    earthquakes: list[Earthquake],
+    airports_by_country: dict[str, list[Airport]],
+    rest_data: dict[str, dict],
+    significant_quakes: dict[str, SignificantEvent],
+    shakemap_grids: dict[str, ShakeMapGrid],
+    config: SeismicRiskConfig,
+) -> list[CountryRiskResult]:
+    """Compute exposure, PAGER context and risk score for each country.
+
+    Pure CPU step: takes already-fetched inputs and performs no I/O.
+    Countries without metadata or without any exposed airport are skipped.
+    """
+    results: list[CountryRiskResult] = []
+    for cc in sorted(airports_by_country):
+        cd = rest_data.get(cc)
+        if not cd:
+            logger.warning("No metadata for %s, skipping", cc)
+            continue
+
+        cc_quakes = [eq for eq in earthquakes if eq.country_code == cc]
+        cc_airports = airports_by_country[cc]
+
+        exposed = find_exposed_airports(
+            airports=cc_airports,
+            earthquakes=cc_quakes,
+            max_distance_km=config.max_airport_distance_km,
+            shakemap_grids=shakemap_grids if config.scoring_method == "shakemap" else None,
+        )
+        if not exposed:
+            continue
+
+        avg_mag, strongest = compute_seismic_stats(cc_quakes)
+        highest_alert, max_felt, has_tsunami, sig_count = compute_pager_context(
+            cc_quakes, significant_quakes
+        )
+        risk_score = calculate_risk_score(
+            airports=cc_airports,
+            earthquakes=cc_quakes,
+            max_distance_km=config.max_airport_distance_km,
+            method=config.scoring_method,
+            earthquake_count=len(cc_quakes),
+            avg_magnitude=avg_mag,
+            exposed_airport_count=len(exposed),
+            exposed_airports=exposed,
+        )
+
+        meta = _extract_country_metadata(cd)
+
+        results.append(
+            CountryRiskResult(
+                country=meta["country"],
+                iso_alpha2=cc,
+                iso_alpha3=meta["iso_alpha3"],
+                capital=meta["capital"],
+                population=meta["population"],
+                area_km2=meta["area_km2"],
+                region=meta["region"],
+                subregion=meta["subregion"],
+                currencies=meta["currencies"],
+                languages=meta["languages"],
+                un_member=meta["un_member"],
+                bordering_countries=meta["bordering_countries"],
+                earthquake_count=len(cc_quakes),
+                avg_magnitude=avg_mag,
+                strongest_earthquake=strongest,
+                highest_pager_alert=highest_alert,
+                max_felt_reports=max_felt,
+                tsunami_warning_issued=has_tsunami,
+                significant_events_count=sig_count,
+                exposed_airports=exposed,
+                earthquakes=cc_quakes,
+                seismic_hub_risk_score=risk_score,
+            )
+        )
+
+    return results
+
+
+@dataclass
+class PipelineInputs:
+    """Everything fetched for one pipeline run (steps 1-6).
+
+    Holds only plain data, so it can be pickled to a worker process for
+    the CPU-bound scoring step.
+    """
+
+    earthquakes: list[Earthquake]
+    airports_by_country: dict[str, list[Airport]]
+    rest_data: dict[str, dict]
+    significant_quakes: dict[str, SignificantEvent]
+    shakemap_grids: dict[str, ShakeMapGrid] = field(default_factory=dict)
+
+
+def fetch_inputs(
+    config: SeismicRiskConfig,
+    session: Session | None = None,
+) -> PipelineInputs | None:
+    """Run the I/O half of the pipeline: fetch, geocode and filter.
+
+    Returns ``None`` when no earthquakes or no qualifying countries are
+    found, in which case the pipeline result is empty.
     """
-    # Create shared HTTP session with retry for all fetchers
-    session = create_session()
+    # Shared HTTP session with retry for all fetchers
+    if session is None:
+        session = create_session()
 
     # Step 1: Fetch earthquakes
     logger.info(
@@ -83,7 +249,7 @@ def run_pipeline(config: SeismicRiskConfig) -> list[CountryRiskResult]:
 
     if not earthquakes:
         logger.warning("No earthquakes found.")
-        return []
+        return None
 
     # Step 2: Reverse-geocode epicenters
     logger.info("Reverse-geocoding %d epicenters...", len(earthquakes))
@@ -107,7 +273,7 @@ def run_pipeline(config: SeismicRiskConfig) -> list[CountryRiskResult]:
 
     if not qualifying_countries:
         logger.warning("No qualifying countries.")
-        return []
+        return None
 
     # Step 4: Fetch significant earthquakes
     logger.info("Fetching USGS significant earthquakes...")
@@ -133,16 +299,15 @@ def run_pipeline(config: SeismicRiskConfig) -> list[CountryRiskResult]:
 
     # Step 5: Fetch airports for qualifying countries
     logger.info("Fetching airports (type=%s)...", config.airport_type)
-    all_airports = fetch_airports(
-        airport_type=config.airport_type,
-        country_codes=qualifying_countries,
+    airport_index = _airports_by_country(
+        config.airport_type,
         session=session,
         use_cache=config.cache_enabled,
+        country_codes=qualifying_countries,
     )
-
-    airports_by_country: dict[str, list] = {}
-    for ap in all_airports:
-        airports_by_country.setdefault(ap.iso_country, []).append(ap)
+    airports_by_country: dict[str, list[Airport]] = {
+        cc: list(aps) for cc, aps in airport_index.items() if cc in qualifying_countries
+    }
 
     has_airports = set(airports_by_country.keys())
     logger.info("Qualifying countries with airports: %s", sorted(has_airports))
@@ -154,72 +319,58 @@ def run_pipeline(config: SeismicRiskConfig) -> list[CountryRiskResult]:
         use_cache=config.cache_enabled,
     )
 
-    # Step 7: Compute exposure and score for each country
-    results: list[CountryRiskResult] = []
-    for cc in sorted(has_airports):
-        cd = rest_data.get(cc)
-        if not cd:
-            logger.warning("No metadata for %s, skipping", cc)
-            continue
-
-        cc_quakes = [eq for eq in earthquakes if eq.country_code == cc]
-        cc_airports = airports_by_country[cc]
-
-        exposed = find_exposed_airports(
-            airports=cc_airports,
-            earthquakes=cc_quakes,
-            max_distance_km=config.max_airport_distance_km,
-            shakemap_grids=shakemap_grids if config.scoring_method == "shakemap" else None,
-        )
-        if not exposed:
-            continue
+    return PipelineInputs(
+        earthquakes=earthquakes,
+        airports_by_country=airports_by_country,
+        rest_data=rest_data,
+        significant_quakes=significant_quakes,
+        shakemap_grids=shakemap_grids,
+    )
 
-        avg_mag, strongest = compute_seismic_stats(cc_quakes)
-        highest_alert, max_felt, has_tsunami, sig_count = compute_pager_context(
-            cc_quakes, significant_quakes
-        )
-        risk_score = calculate_risk_score(
-            airports=cc_airports,
-            earthquakes=cc_quakes,
-            max_distance_km=config.max_airport_distance_km,
-            method=config.scoring_method,
-            earthquake_count=len(cc_quakes),
-            avg_magnitude=avg_mag,
-            exposed_airport_count=len(exposed),
-            exposed_airports=exposed,
-        )
 
-        meta = _extract_country_metadata(cd)
-
-        results.append(
-            CountryRiskResult(
-                country=meta["country"],
-                iso_alpha2=cc,
-                iso_alpha3=meta["iso_alpha3"],
-                capital=meta["capital"],
-                population=meta["population"],
-                area_km2=meta["area_km2"],
-                region=meta["region"],
-                subregion=meta["subregion"],
-                currencies=meta["currencies"],
-                languages=meta["languages"],
-                un_member=meta["un_member"],
-                bordering_countries=meta["bordering_countries"],
-                earthquake_count=len(cc_quakes),
-                avg_magnitude=avg_mag,
-                strongest_earthquake=strongest,
-                highest_pager_alert=highest_alert,
-                max_felt_reports=max_felt,
-                tsunami_warning_issued=has_tsunami,
-                significant_events_count=sig_count,
-                exposed_airports=exposed,
-                earthquakes=cc_quakes,
-                seismic_hub_risk_score=risk_score,
-            )
-        )
+def score_inputs(
+    inputs: PipelineInputs,
+    config: SeismicRiskConfig,
+) -> list[CountryRiskResult]:
+    """Run the CPU half of the pipeline: score countries and rank them."""
+    # Step 7: Compute exposure and score for each country
+    results = _score_countries(
+        earthquakes=inputs.earthquakes,
+        airports_by_country=inputs.airports_by_country,
+        rest_data=inputs.rest_data,
+        significant_quakes=inputs.significant_quakes,
+        shakemap_grids=inputs.shakemap_grids,
+        config=config,
+    )
 
     # Step 8: Sort by risk score descending
     results.sort(key=lambda r: r.seismic_hub_risk_score, reverse=True)
     logger.info("Final qualifying countries: %d", len(results))
 
     return results
+
+
+def run_pipeline(
+    config: SeismicRiskConfig,
+    session: Session | None = None,
+) -> list[CountryRiskResult]:
+    """Execute the full seismic risk assessment pipeline.
+
+    Steps:
+    1. Fetch earthquakes from USGS
+    2. Reverse-geocode epicenters to country codes
+    3. Count per country, filter by minimum threshold
+    4. Fetch significant earthquakes feed
+    5. Fetch airports for qualifying countries
+    6. Fetch REST Countries metadata
+    7. Compute exposure, stats, and score per country
+    8. Sort by risk score descending
+
+    Pass *session* to reuse a pooled HTTP session across runs (e.g. from
+    worker threads); otherwise a fresh retry-enabled session is created.
+    Steps 1-6 are :func:`fetch_inputs`; steps 7-8 are :func:`score_inputs`.
+    """
+    inputs = fetch_inputs(config, session=session)
+    if inputs is None:
+        return []
+    return score_inputs(inputs, config)
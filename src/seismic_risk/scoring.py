@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import math
 from datetime import datetime, timezone
+from operator import attrgetter
+
+import numpy as np
 
 from seismic_risk.config import ScoringMethod
-from seismic_risk.fetchers.shakemap import ShakeMapGrid, interpolate_pga
-from seismic_risk.geo import haversine
+from seismic_risk.fetchers.shakemap import ShakeMapGrid, interpolate_pga_batch
+from seismic_risk.geo import haversine_batch
 from seismic_risk.models import (
     Airport,
     Earthquake,
@@ -31,6 +34,14 @@ def _heuristic_contribution(magnitude: float, distance_km: float, depth_km: floa
     return energy / math.pow(r + 1, 1.2) * math.exp(-0.003 * r)
 
 
+def _quake_coordinates(earthquakes: list[Earthquake]) -> tuple[np.ndarray, np.ndarray]:
+    """Epicentre latitudes and longitudes as arrays for haversine_batch."""
+    n = len(earthquakes)
+    lats = np.fromiter((eq.latitude for eq in earthquakes), np.float64, n)
+    lons = np.fromiter((eq.longitude for eq in earthquakes), np.float64, n)
+    return lats, lons
+
+
 def find_exposed_airports(
     airports: list[Airport],
     earthquakes: list[Earthquake],
@@ -39,58 +50,67 @@ def find_exposed_airports(
 ) -> list[ExposedAirport]:
     """Find airports within the exposure radius of at least one earthquake.
 
-    Populates per-airport nearby_quakes and exposure_score.
+    Populates per-airport nearby_quakes and exposure_score.  The returned
+    list is ordered by exposure_score, highest first.
 
     When *shakemap_grids* is provided, PGA from the ShakeMap grid is used
     as the exposure contribution (in %g) for quakes with available grids.
     Falls back to the heuristic formula for quakes without a grid or for
     airport locations outside the grid bounds.
     """
+    eq_lats, eq_lons = _quake_coordinates(earthquakes)
+
+    # Interpolate each quake's grid at every airport in one vectorized call
+    grid_values: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    if shakemap_grids:
+        lats = np.fromiter((ap.latitude for ap in airports), np.float64, len(airports))
+        lons = np.fromiter((ap.longitude for ap in airports), np.float64, len(airports))
+        for eq in earthquakes:
+            grid = shakemap_grids.get(eq.id)
+            if grid is not None and eq.id not in grid_values:
+                grid_values[eq.id] = interpolate_pga_batch(grid, lats, lons)
+
     exposed: list[ExposedAirport] = []
-    for ap in airports:
+    for i, ap in enumerate(airports):
         nearby: list[NearbyQuake] = []
         score = 0.0
         best = float("inf")
 
-        for eq in earthquakes:
-            d = haversine(ap.latitude, ap.longitude, eq.latitude, eq.longitude)
-            if d <= max_distance_km:
-                pga_g_val: float | None = None
-                mmi_val: float | None = None
-
-                if shakemap_grids and eq.id in shakemap_grids:
-                    result = interpolate_pga(
-                        shakemap_grids[eq.id], ap.latitude, ap.longitude,
-                    )
-                    if result is not None:
-                        pga_pctg, mmi_interp = result
-                        pga_g_val = round(pga_pctg / 100, 6)
-                        mmi_val = round(mmi_interp, 1)
-                        contribution = pga_pctg  # PGA in %g as contribution
-                    else:
-                        # Airport outside grid bounds — heuristic fallback
-                        contribution = _heuristic_contribution(eq.magnitude, d, eq.depth_km)
-                else:
-                    # No grid for this quake — heuristic
-                    contribution = _heuristic_contribution(eq.magnitude, d, eq.depth_km)
-
-                score += contribution
-                nearby.append(
-                    NearbyQuake(
-                        earthquake_id=eq.id,
-                        magnitude=eq.magnitude,
-                        latitude=eq.latitude,
-                        longitude=eq.longitude,
-                        depth_km=eq.depth_km,
-                        time_ms=eq.time_ms,
-                        place=eq.place,
-                        distance_km=round(d, 1),
-                        exposure_contribution=round(contribution, 2),
-                        pga_g=pga_g_val,
-                        mmi=mmi_val,
-                    )
+        distances = haversine_batch(ap.latitude, ap.longitude, eq_lats, eq_lons)
+        for j in np.flatnonzero(distances <= max_distance_km).tolist():
+            eq = earthquakes[j]
+            d = float(distances[j])
+            pga_g_val: float | None = None
+            mmi_val: float | None = None
+
+            values = grid_values.get(eq.id)
+            pga_pctg = float(values[0][i]) if values is not None else math.nan
+            if not math.isnan(pga_pctg):
+                assert values is not None  # for mypy
+                pga_g_val = round(pga_pctg / 100, 6)
+                mmi_val = round(float(values[1][i]), 1)
+                contribution = pga_pctg  # PGA in %g as contribution
+            else:
+                # No grid for this quake, or airport outside its bounds
+                contribution = _heuristic_contribution(eq.magnitude, d, eq.depth_km)
+
+            score += contribution
+            nearby.append(
+                NearbyQuake(
+                    earthquake_id=eq.id,
+                    magnitude=eq.magnitude,
+                    latitude=eq.latitude,
+                    longitude=eq.longitude,
+                    depth_km=eq.depth_km,
+                    time_ms=eq.time_ms,
+                    place=eq.place,
+                    distance_km=round(d, 1),
+                    exposure_contribution=round(contribution, 2),
+                    pga_g=pga_g_val,
+                    mmi=mmi_val,
                 )
-                best = min(best, d)
+            )
+            best = min(best, d)
 
         if nearby:
             nearby.sort(key=lambda q: q.distance_km)
@@ -106,6 +126,7 @@ def find_exposed_airports(
                     exposure_score=round(score, 2),
                 )
             )
+    exposed.sort(key=attrgetter("exposure_score"), reverse=True)
     return exposed
 
 
@@ -184,14 +205,15 @@ def calculate_exposure_score(
     Returns the total exposure across all airports in the country.
     """
     total_exposure = 0.0
+    eq_lats, eq_lons = _quake_coordinates(earthquakes)
 
     for ap in airports:
-        for eq in earthquakes:
-            distance = haversine(ap.latitude, ap.longitude, eq.latitude, eq.longitude)
-            if distance <= max_distance_km:
-                total_exposure += _heuristic_contribution(
-                    eq.magnitude, distance, eq.depth_km,
-                )
+        distances = haversine_batch(ap.latitude, ap.longitude, eq_lats, eq_lons)
+        for j in np.flatnonzero(distances <= max_distance_km).tolist():
+            eq = earthquakes[j]
+            total_exposure += _heuristic_contribution(
+                eq.magnitude, float(distances[j]), eq.depth_km,
+            )
 
     return round(total_exposure, 2)
 
@@ -216,7 +238,7 @@ def calculate_risk_score(
     airports: list[Airport],
     earthquakes: list[Earthquake],
     max_distance_km: float = 200.0,
-    method: ScoringMethod = "shakemap",
+    method: ScoringMethod = ScoringMethod.SHAKEMAP,
     # Legacy params (only used when method="legacy")
     earthquake_count: int | None = None,
     avg_magnitude: float | None = None,
@@ -9,6 +9,7 @@ import numpy as np
 import pytest
 
 from seismic_risk.config import SeismicRiskConfig
+from seismic_risk.fetchers import countries
 from seismic_risk.fetchers.shakemap import ShakeMapGrid
 from seismic_risk.history import AirportTrend, CountryTrend, TrendSummary
 from seismic_risk.models import (
@@ -19,10 +20,18 @@ from seismic_risk.models import (
     NearbyQuake,
     StrongestEarthquake,
 )
+from seismic_risk.pipeline import _airport_index
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _reset_in_process_caches() -> None:
+    """Keep in-process airport and country caches from leaking across tests."""
+    _airport_index.clear()
+    countries._memo.clear()
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     return FIXTURES_DIR
@@ -305,7 +314,7 @@ def sample_shakemap_grid() -> ShakeMapGrid:
             [3.0, 5.0, 8.0, 5.0, 3.0],
             [2.0, 3.0, 4.0, 3.0, 2.0],
         ],
-        dtype=np.float64,
+        dtype=np.float32,
     )
     mmi = np.array(
         [
@@ -315,7 +324,7 @@ def sample_shakemap_grid() -> ShakeMapGrid:
             [3.5, 4.5, 5.5, 4.5, 3.5],
             [3.0, 3.5, 4.0, 3.5, 3.0],
         ],
-        dtype=np.float64,
+        dtype=np.float32,
     )
     return ShakeMapGrid(
         event_id="us2025abc3",
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
+from dataclasses import asdict
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import responses
 from fastapi.testclient import TestClient
 
-from seismic_risk.api import app
+from seismic_risk.api import _json_response, app
 
 
 @pytest.fixture(scope="module")
@@ -60,6 +62,35 @@ class TestHealthEndpoint:
         assert "run_count" in data
 
 
+class TestLifespan:
+    def test_shared_session_reused_and_closed(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """One HTTP session is shared by /risk calls and closed on shutdown."""
+        # Restore the module client's session once this nested lifespan exits
+        monkeypatch.setattr(app.state, "http", app.state.http)
+        session = MagicMock()
+        with (
+            patch("seismic_risk.api.create_session", return_value=session),
+            patch("seismic_risk.api.run_pipeline", return_value=[]) as run,
+            TestClient(app) as c,
+        ):
+            c.get("/risk")
+            c.get("/risk")
+            assert all(call.kwargs["session"] is session for call in run.call_args_list)
+            session.close.assert_not_called()
+
+        session.close.assert_called_once()
+
+
+class TestJsonResponse:
+    def test_matches_asdict_encoding(self, sample_results) -> None:
+        """Direct dataclass encoding yields the same document as asdict()."""
+        resp = _json_response(sample_results)
+        assert resp.media_type == "application/json"
+        assert json.loads(resp.body) == [asdict(r) for r in sample_results]
+
+
 class TestRiskEndpoint:
     @responses.activate
     def test_json_format_default(
@@ -136,6 +167,47 @@ class TestRiskEndpoint:
         assert "text/html" in resp.headers["content-type"]
         assert "<!DOCTYPE html>" in resp.text
 
+    @responses.activate
+    def test_html_layers_can_be_left_out(
+        self,
+        client: TestClient,
+        sample_usgs_response: dict,
+        sample_significant_response: dict,
+        sample_airports_csv_path: Path,
+        sample_countries: dict,
+    ) -> None:
+        """HTML-only query flags drop the optional map layers."""
+        _mock_pipeline_deps(
+            sample_usgs_response,
+            sample_significant_response,
+            str(sample_airports_csv_path),
+            sample_countries,
+        )
+        mock_geo = [{"cc": "JP"}] * 3 + [{"cc": "CL"}] * 2
+        with (
+            patch("seismic_risk.geo.rg.search", return_value=mock_geo),
+            patch(
+                "seismic_risk.fetchers.airports.OURAIRPORTS_CSV_URL",
+                str(sample_airports_csv_path),
+            ),
+        ):
+            resp = client.get(
+                "/risk",
+                params={
+                    "format": "html",
+                    "min_magnitude": 4.0,
+                    "days": 30,
+                    "min_quakes": 3,
+                    "distance": 400.0,
+                    "connections": False,
+                    "all_quakes": False,
+                },
+            )
+
+        assert resp.status_code == 200
+        assert '"layers":{"connections":false,"all_quakes":false}' in resp.text
+        assert '"connections":[]' in resp.text
+
     @responses.activate
     def test_csv_format(
         self,
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from datetime import date
+from unittest.mock import MagicMock, patch
 
-from backfill import generate_month_ranges
+from backfill import _score_month, generate_month_ranges
+
+from seismic_risk.config import SeismicRiskConfig
 
 
 class TestGenerateMonthRanges:
@@ -51,3 +54,33 @@ class TestGenerateMonthRanges:
         """Returns empty list when start is at or after end."""
         months = generate_month_ranges(2025, 3, end_date=date(2025, 3, 1))
         assert months == []
+
+    def test_same_end_month_returns_equal_independent_lists(self) -> None:
+        """Any end date within a month yields the same ranges, as fresh lists."""
+        a = generate_month_ranges(2024, 1, end_date=date(2024, 4, 2))
+        b = generate_month_ranges(2024, 1, end_date=date(2024, 4, 28))
+        assert a == b
+        a.clear()
+        assert len(b) == 3
+
+
+class TestScoreMonth:
+    def test_saves_snapshot_and_returns_counts(self, tmp_path, sample_results) -> None:
+        """A scored month writes its snapshot and reports result counts."""
+        inputs = MagicMock()
+        config = SeismicRiskConfig(starttime="2024-01-01", endtime="2024-01-31")
+        with patch("backfill.score_inputs", return_value=sample_results) as score:
+            countries, airports = _score_month(
+                inputs, config, tmp_path, "heuristic", date(2024, 1, 31),
+            )
+
+        score.assert_called_once_with(inputs, config)
+        assert countries == len(sample_results)
+        assert airports == sum(len(r.exposed_airports) for r in sample_results)
+        assert (tmp_path / "2024-01-31.json").exists()
+
+    def test_month_without_inputs_saves_empty_snapshot(self, tmp_path) -> None:
+        """Months with nothing to score still produce a snapshot."""
+        config = SeismicRiskConfig(starttime="2024-01-01", endtime="2024-01-31")
+        assert _score_month(None, config, tmp_path, "heuristic", date(2024, 1, 31)) == (0, 0)
+        assert (tmp_path / "2024-01-31.json").exists()
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
-import json
 import time
 
-from seismic_risk.cache import cache_get, cache_put, get_cache_dir
+from seismic_risk.cache import (
+    _key_path,
+    cache_get,
+    cache_get_stale,
+    cache_put,
+    cache_touch,
+    get_cache_dir,
+)
+
+
+def _write_raw(key: str, data: bytes) -> None:
+    """Write *data* at *key*'s path, bypassing the entry header."""
+    path = _key_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
 
 
 class TestCacheLayer:
@@ -22,11 +35,47 @@ class TestCacheLayer:
     def test_expired_returns_none(self, monkeypatch, tmp_path):
         monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
         cache_put("old.bin", b"stale data")
-        # Backdate the meta timestamp
-        meta_path = tmp_path / "old.bin.meta"
-        meta_path.write_text(json.dumps({"timestamp": time.time() - 7200}))
+        # Fast-forward the clock past the TTL
+        now = time.time()
+        monkeypatch.setattr("seismic_risk.cache.time.time", lambda: now + 7200)
         assert cache_get("old.bin", max_age_seconds=3600) is None
 
+    def test_single_file_per_entry(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        cache_put("one.bin", b"payload")
+        files = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert files == [_key_path("one.bin")]
+
+    def test_entries_sharded_by_hash_prefix(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        path = _key_path("airports.csv")
+        assert path.parent.parent == tmp_path
+        assert len(path.parent.name) == 2
+        assert _key_path("airports.csv") == path
+
+    def test_memory_hit_skips_disk(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        cache_put("mem.bin", b"in memory")
+        _key_path("mem.bin").unlink()
+        assert cache_get("mem.bin", max_age_seconds=3600) == b"in memory"
+
+    def test_large_payloads_not_kept_in_memory(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        monkeypatch.setattr("seismic_risk.cache._MEMORY_MAX_ENTRY_BYTES", 4)
+        cache_put("big.bin", b"too large")
+        _key_path("big.bin").unlink()
+        assert cache_get("big.bin", max_age_seconds=3600) is None
+
+    def test_memory_bounded_by_total_bytes(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        monkeypatch.setattr("seismic_risk.cache._MEMORY_MAX_BYTES", 8)
+        cache_put("first.bin", b"12345")
+        cache_put("second.bin", b"67890")
+        _key_path("first.bin").unlink()
+        _key_path("second.bin").unlink()
+        assert cache_get("first.bin", max_age_seconds=3600) is None
+        assert cache_get("second.bin", max_age_seconds=3600) == b"67890"
+
     def test_cache_dir_created(self, monkeypatch, tmp_path):
         cache_dir = tmp_path / "sub" / "deep"
         monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", cache_dir)
@@ -41,8 +90,44 @@ class TestCacheLayer:
         assert cache_get("a.bin", max_age_seconds=3600) == b"alpha"
         assert cache_get("b.bin", max_age_seconds=3600) == b"bravo"
 
-    def test_corrupted_meta_returns_none(self, monkeypatch, tmp_path):
+    def test_lookups_do_not_create_directories(self, monkeypatch, tmp_path):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", cache_dir)
+        assert cache_get("missing.bin", max_age_seconds=3600) is None
+        assert cache_get_stale("missing.bin") is None
+        assert cache_touch("missing.bin") is False
+        assert not cache_dir.exists()
+
+    def test_corrupted_entry_returns_none(self, monkeypatch, tmp_path):
         monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
-        (tmp_path / "bad.bin").write_bytes(b"data")
-        (tmp_path / "bad.bin.meta").write_text("not json")
+        _write_raw("bad.bin", b"not a cache entry")
         assert cache_get("bad.bin", max_age_seconds=3600) is None
+
+    def test_truncated_entry_returns_none(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        _write_raw("short.bin", b"SRC")
+        assert cache_get("short.bin", max_age_seconds=3600) is None
+
+    def test_stale_read_ignores_age(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        cache_put("old.bin", b"stale data")
+        now = time.time()
+        monkeypatch.setattr("seismic_risk.cache.time.time", lambda: now + 7200)
+        assert cache_get("old.bin", max_age_seconds=3600) is None
+        assert cache_get_stale("old.bin") == b"stale data"
+
+    def test_touch_makes_expired_entry_fresh(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        cache_put("old.bin", b"stale data")
+        now = time.time()
+        monkeypatch.setattr("seismic_risk.cache.time.time", lambda: now + 7200)
+        assert cache_touch("old.bin") is True
+        assert cache_get("old.bin", max_age_seconds=3600) == b"stale data"
+        assert _key_path("old.bin").read_bytes().endswith(b"stale data")
+
+    def test_touch_missing_or_corrupt_entry(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        assert cache_touch("missing.bin") is False
+        _write_raw("bad.bin", b"not a cache entry")
+        assert cache_touch("bad.bin") is False
+        assert _key_path("bad.bin").read_bytes() == b"not a cache entry"
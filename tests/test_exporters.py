@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import copy
+import io
 import json
+from collections.abc import Mapping
 from dataclasses import replace
 
+import pytest
+
 from seismic_risk.exporters.csv_export import export_csv
-from seismic_risk.exporters.geojson_export import export_geojson
-from seismic_risk.exporters.html_export import export_html
+from seismic_risk.exporters.geojson_export import export_geojson, export_geojson_seq
+from seismic_risk.exporters.html_export import _write_geojson_data, export_html
 from seismic_risk.exporters.json_export import export_json
 from seismic_risk.exporters.markdown_export import export_markdown
 
 
+def _embedded_map_data(results, **layers):
+    """Stream the HTML map data block and parse it back."""
+    buf = io.StringIO()
+    _write_geojson_data(buf, results, **layers)
+    return json.loads(buf.getvalue())
+
+
 class TestJSONExport:
     def test_exports_list_of_dicts(self, sample_results, tmp_path):
         output = tmp_path / "test.json"
@@ -30,6 +41,23 @@ class TestJSONExport:
         result = export_json(sample_results, output)
         assert result == output
 
+    def test_writes_to_text_stream(self, sample_results, tmp_path):
+        buf = io.StringIO()
+        assert export_json(sample_results, buf) is buf
+        assert not buf.closed
+
+        output = tmp_path / "test.json"
+        export_json(sample_results, output)
+        assert buf.getvalue() == output.read_text(encoding="utf-8")
+
+    def test_matches_asdict_serialization(self, sample_results):
+        from dataclasses import asdict
+
+        buf = io.StringIO()
+        export_json(sample_results, buf)
+        expected = [asdict(r) for r in sample_results]
+        assert buf.getvalue() == json.dumps(expected, indent=2, ensure_ascii=False)
+
 
 class TestGeoJSONExport:
     def test_exports_feature_collection(self, sample_results, tmp_path):
@@ -129,6 +157,16 @@ class TestGeoJSONExport:
         assert data["type"] == "FeatureCollection"
         assert data["features"] == []
 
+    def test_one_feature_per_line(self, sample_results, tmp_path):
+        output = tmp_path / "test.geojson"
+        export_geojson(sample_results, output)
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        data = json.loads("\n".join(lines))
+        feature_lines = lines[1:-1]
+        assert len(feature_lines) == len(data["features"])
+        assert json.loads(feature_lines[0].rstrip(",")) == data["features"][0]
+
     def test_connection_features_present(self, sample_results, tmp_path):
         output = tmp_path / "test.geojson"
         export_geojson(sample_results, output)
@@ -195,6 +233,67 @@ class TestGeoJSONExport:
         m48 = [q for q in quakes if q["properties"]["magnitude"] == 4.8][0]
         assert m61["properties"]["felt_radius_km"] > m48["properties"]["felt_radius_km"]
 
+    def test_earthquakes_deduplicated_across_countries(self, sample_results, tmp_path):
+        shared = sample_results[0].earthquakes[0]
+        neighbour = replace(
+            sample_results[0], country="Neighbour", iso_alpha3="NBR",
+            exposed_airports=[], earthquakes=[shared],
+        )
+        results = [sample_results[0], neighbour]
+        output = tmp_path / "test.geojson"
+        export_geojson(results, output)
+
+        data = json.loads(output.read_text())
+        quake_ids = [
+            f["properties"]["earthquake_id"] for f in data["features"]
+            if f["properties"]["feature_type"] == "earthquake"
+        ]
+        assert quake_ids.count(shared.id) == 1
+        assert data["metadata"]["earthquake_count"] == len(quake_ids)
+
+    def test_pretty_output_matches_compact(self, sample_results, tmp_path):
+        compact = tmp_path / "compact.geojson"
+        pretty = tmp_path / "pretty.geojson"
+        export_geojson(sample_results, compact)
+        export_geojson(sample_results, pretty, pretty=True)
+
+        assert ": " not in compact.read_text().split("\n", 1)[0]
+        assert pretty.stat().st_size > compact.stat().st_size
+        compact_data = json.loads(compact.read_text())
+        pretty_data = json.loads(pretty.read_text())
+        assert compact_data["features"] == pretty_data["features"]
+
+    def test_geojson_seq_one_feature_per_line(self, sample_results, tmp_path):
+        collection = tmp_path / "test.geojson"
+        sequence = tmp_path / "test.geojsonl"
+        export_geojson(sample_results, collection)
+        export_geojson_seq(sample_results, sequence)
+
+        lines = sequence.read_text().splitlines()
+        features = [json.loads(line) for line in lines]
+        assert features == json.loads(collection.read_text())["features"]
+
+    def test_utc_day_matches_utc_date(self):
+        from datetime import datetime, timezone
+
+        from seismic_risk.exporters._features import utc_day
+
+        for time_ms in (0, -1, 86_399_999, 86_400_000, 1_707_000_000_000):
+            expected = datetime.fromtimestamp(time_ms / 1000, tz=timezone.utc)
+            assert utc_day(time_ms) == expected.strftime("%Y-%m-%d")
+
+    def test_features_grouped_by_country(self, sample_results):
+        from seismic_risk.exporters.geojson_export import _iter_features
+
+        kinds = [f["properties"]["feature_type"] for f in _iter_features(sample_results[:1])]
+        result = sample_results[0]
+        n_airports = len(result.exposed_airports)
+        n_connections = sum(len(a.nearby_quakes) for a in result.exposed_airports)
+        assert kinds[0] == "airport"
+        assert kinds.count("airport") == n_airports
+        assert kinds.count("connection") == n_connections
+        assert kinds[n_airports + n_connections:] == ["earthquake"] * len(result.earthquakes)
+
 
 class TestHTMLExport:
     def test_exports_valid_html(self, sample_results, tmp_path):
@@ -267,14 +366,8 @@ class TestHTMLExport:
         assert "'Connections'" in content
 
     def test_airport_features_have_movements_property(self, sample_results, tmp_path):
-        from seismic_risk.exporters.html_export import _build_geojson_data
-
-        data = _build_geojson_data(sample_results)
-        airport_features = [
-            f for f in data["features"]
-            if f["properties"]["feature_type"] == "airport"
-        ]
-        for af in airport_features:
+        data = _embedded_map_data(sample_results)
+        for af in data["airports"]:
             assert "aircraft_movements_k" in af["properties"]
             assert af["properties"]["aircraft_movements_k"] > 0
 
@@ -291,8 +384,19 @@ class TestHTMLExport:
         export_html(sample_results, output)
 
         content = output.read_text()
-        assert "L.divIcon" in content
-        assert "airportSVG" in content
+        assert "DiamondMarker" in content
+        assert "L.canvas" in content
+        assert "L.divIcon" not in content
+
+    def test_vector_layers_share_one_canvas(self, sample_results, tmp_path):
+        output = tmp_path / "test.html"
+        export_html(sample_results, output)
+
+        content = output.read_text()
+        assert "renderer: L.canvas({ padding: 0.5 })" in content
+        assert content.count("L.canvas(") == 1
+        assert "createPane" not in content
+        assert "layer.on('add', raiseAirports)" in content
 
     def test_earthquakes_off_by_default(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
@@ -303,6 +407,22 @@ class TestHTMLExport:
         assert "nearbyQuakeLayer.addTo(map)" not in content
         assert "allQuakeLayer.addTo(map)" not in content
 
+    def test_all_quake_layer_built_lazily(self, sample_results, tmp_path):
+        output = tmp_path / "test.html"
+        export_html(sample_results, output)
+
+        content = output.read_text()
+        assert "allQuakeLayer = L.geoJSON(null" in content
+        assert "allQuakeLayer.once('add'" in content
+
+    def test_color_ramps_precomputed(self, sample_results, tmp_path):
+        output = tmp_path / "test.html"
+        export_html(sample_results, output)
+
+        content = output.read_text()
+        assert "var exposureRamp = buildRamp(" in content
+        assert "var quakeRamp = buildRamp(" in content
+
     def test_quake_layers_are_mutually_exclusive(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
         export_html(sample_results, output)
@@ -335,7 +455,9 @@ class TestHTMLExport:
         export_html(sample_results, output)
 
         content = output.read_text()
-        assert "layer.on('click'" in content
+        # One delegated handler on the group, not one per marker
+        assert "airportLayer.on('click'" in content
+        assert " layer.on('click'" not in content
 
     def test_map_click_clears_selection(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
@@ -345,12 +467,13 @@ class TestHTMLExport:
         assert "map.on('click'" in content
         assert "clearSelection()" in content
 
-    def test_highlight_css_present(self, sample_results, tmp_path):
+    def test_highlight_style_present(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
         export_html(sample_results, output)
 
         content = output.read_text()
-        assert "airport-selected" in content
+        assert "AIRPORT_SELECTED_STROKE" in content
+        assert "selectedMarker.setStyle(AIRPORT_STROKE)" in content
 
     def test_includes_movements_in_legend(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
@@ -360,14 +483,8 @@ class TestHTMLExport:
         assert "movements/yr" in content
 
     def test_earthquake_features_have_felt_radius(self, sample_results, tmp_path):
-        from seismic_risk.exporters.html_export import _build_geojson_data
-
-        data = _build_geojson_data(sample_results)
-        quakes = [
-            f for f in data["features"]
-            if f["properties"]["feature_type"] == "earthquake"
-        ]
-        for q in quakes:
+        data = _embedded_map_data(sample_results)
+        for q in data["quakes"]:
             assert "felt_radius_km" in q["properties"]
             assert q["properties"]["felt_radius_km"] >= 5.0
 
@@ -408,11 +525,79 @@ class TestHTMLExport:
         content = output.read_text()
         # The raw </script> must not appear inside the GeoJSON data block
         script_start = content.index("var data = ")
-        script_end = content.index("// Categorize features")
+        script_end = content.index("var trendData = ")
         data_block = content[script_start:script_end]
         assert "</script>" not in data_block
         assert r"<\/script>" in data_block
 
+    def test_embedded_features_omit_null_properties(self, sample_results):
+        data = _embedded_map_data(sample_results)
+        for features in data.values():
+            for feature in features:
+                assert None not in feature["properties"].values()
+        assert "max_pga_g" not in data["airports"][0]["properties"]
+
+    def test_embedded_features_grouped_by_layer(self, sample_results):
+        data = _embedded_map_data(sample_results)
+        assert list(data) == ["airports", "quakes", "connections"]
+        assert len(data["airports"]) == 2
+        assert len(data["quakes"]) == 3
+        assert len(data["connections"]) == 4
+        for features in data.values():
+            for feature in features:
+                assert "feature_type" not in feature["properties"]
+
+    def test_optional_layers_can_be_left_out(self, sample_results):
+        data = _embedded_map_data(sample_results, include_all_quakes=False)
+        linked = {c["properties"]["earthquake_id"] for c in data["connections"]}
+        assert {q["properties"]["earthquake_id"] for q in data["quakes"]} == linked
+        assert len(data["quakes"]) < len(_embedded_map_data(sample_results)["quakes"])
+
+        data = _embedded_map_data(
+            sample_results, include_connections=False, include_all_quakes=False
+        )
+        assert data["connections"] == []
+        assert data["quakes"] == []
+        assert len(data["airports"]) == 2
+
+    def test_excluded_layers_reported_to_page(self, sample_results, tmp_path):
+        output = tmp_path / "test.html"
+        export_html(sample_results, output, include_connections=False)
+
+        content = output.read_text()
+        assert '"layers":{"connections":false,"all_quakes":true}' in content
+        assert '"connections":[]' in content
+
+    def test_quake_count_covers_excluded_quakes(self, sample_results):
+        from seismic_risk.exporters.html_export import _build_summary_data
+
+        summary = _build_summary_data(sample_results, include_all_quakes=False)
+        assert summary["quake_count"] == sum(len(r.earthquakes) for r in sample_results)
+
+    def test_compress_writes_gzip_sibling(self, sample_results, tmp_path):
+        import gzip
+
+        output = tmp_path / "test.html"
+        export_html(sample_results, output, compress=True)
+
+        compressed = tmp_path / "test.html.gz"
+        assert gzip.decompress(compressed.read_bytes()) == output.read_bytes()
+
+    def test_compress_rejects_streams(self, sample_results):
+        with pytest.raises(ValueError, match="file path"):
+            export_html(sample_results, io.StringIO(), compress=True)
+
+    def test_summary_data_ranks_airports(self, sample_results):
+        from seismic_risk.exporters.html_export import _build_summary_data
+
+        summary = _build_summary_data(sample_results)
+        airports = [a for r in sample_results for a in r.exposed_airports]
+        scores = [a["exposure_score"] for a in summary["top_airports"]]
+        assert scores == sorted(scores, reverse=True)
+        assert len(scores) == min(5, len(airports))
+        assert summary["max_score"] == max(1.0, *(a.exposure_score for a in airports))
+        assert summary["max_contrib"] >= 1.0
+
     def test_overlayremove_clears_highlighted_quakes(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
         export_html(sample_results, output)
@@ -427,9 +612,18 @@ class TestHTMLExport:
 
         content = output.read_text()
         assert "var trendData =" in content
-        assert '"history_days": 7' in content
+        assert '"history_days":7' in content
         assert '"JPN"' in content
 
+    def test_trend_entries_carry_only_used_fields(self, sample_trends):
+        from seismic_risk.exporters.html_export import _build_trend_data
+
+        data = _build_trend_data(sample_trends)
+        entries = [*data["countries"].values(), *data["airports"].values()]
+        assert entries
+        for entry in entries:
+            assert set(entry) == {"scores", "delta", "direction", "days_tracked"}
+
     def test_trend_data_null_without_trends(self, sample_results, tmp_path):
         output = tmp_path / "test.html"
         export_html(sample_results, output)
@@ -511,7 +705,7 @@ class TestHTMLExport:
         export_html(sample_results, output, trends=trends_no_airports)
 
         content = output.read_text()
-        assert '"airports": {}' in content
+        assert '"airports":{}' in content
 
 
 class TestAirportMovementsData:
@@ -521,7 +715,7 @@ class TestAirportMovementsData:
             DEFAULT_MOVEMENTS,
         )
 
-        assert isinstance(AIRPORT_MOVEMENTS, dict)
+        assert isinstance(AIRPORT_MOVEMENTS, Mapping)
         assert len(AIRPORT_MOVEMENTS) >= 100
         for code, mvmts in AIRPORT_MOVEMENTS.items():
             assert len(code) == 3, f"Invalid IATA code: {code}"
@@ -529,6 +723,12 @@ class TestAirportMovementsData:
             assert mvmts > 0
         assert DEFAULT_MOVEMENTS > 0
 
+    def test_movements_data_is_read_only(self):
+        from seismic_risk.data.airport_movements import AIRPORT_MOVEMENTS
+
+        with pytest.raises(TypeError):
+            AIRPORT_MOVEMENTS["XXX"] = 1.0  # type: ignore[index]
+
     def test_known_airports_have_movements(self):
         from seismic_risk.data.airport_movements import AIRPORT_MOVEMENTS
 
@@ -561,6 +761,14 @@ class TestCSVExport:
         result = export_csv(sample_results, output)
         assert result == output
 
+    def test_writes_to_text_stream(self, sample_results, tmp_path):
+        buf = io.StringIO(newline="")
+        export_csv(sample_results, buf)
+
+        output = tmp_path / "test.csv"
+        export_csv(sample_results, output)
+        assert buf.getvalue() == output.read_bytes().decode("utf-8")
+
     def test_correct_column_count(self, sample_results, tmp_path):
         import csv
 
@@ -800,6 +1008,25 @@ class TestMarkdownExport:
         assert "NEW" in content
         assert "**New entries**: Japan" in content
 
+    def test_untracked_country_shown_as_new(self, sample_results, tmp_path):
+        from seismic_risk.history import TrendSummary
+
+        trends = TrendSummary(
+            date="2026-02-06",
+            history_days=1,
+            history_start="2026-02-06",
+            country_trends={},
+            airport_trends={},
+            new_countries=[],
+            gone_countries=[],
+        )
+        output = tmp_path / "test.md"
+        export_markdown(sample_results, output, trends=trends)
+
+        content = output.read_text()
+        row = next(line for line in content.splitlines() if line.startswith("| Japan |"))
+        assert row.split(" | ")[4] == "NEW"
+
     def test_gone_country_listed(self, sample_results, tmp_path):
         from seismic_risk.history import CountryTrend, TrendSummary
 
@@ -958,3 +1185,15 @@ class TestPGAExporterIntegration:
 
         content = output.read_text()
         assert "| Max PGA (g) |" not in content
+
+    def test_markdown_zero_pga_still_shows_column(self, sample_results, tmp_path):
+        results = copy.deepcopy(sample_results)
+        nrt = results[0].exposed_airports[0]
+        nrt.nearby_quakes[0] = replace(nrt.nearby_quakes[0], pga_g=0.0)
+        output = tmp_path / "test.md"
+        export_markdown(results, output)
+
+        content = output.read_text()
+        assert "| Max PGA (g) |" in content
+        assert "| 0.0000 |" in content
+        assert "| - |" in content
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import time
+
 import pytest
 import responses
 from requests.exceptions import ConnectionError as RequestsConnectionError
@@ -215,6 +218,63 @@ class TestFetchAirports:
         result = fetch_airports(url=str(csv_path), use_cache=False)
         assert result == []
 
+    def test_missing_iata_and_municipality_defaults(self, tmp_path):
+        csv_path = tmp_path / "airports.csv"
+        csv_path.write_text(
+            "type,name,latitude_deg,longitude_deg,iso_country,municipality,iata_code\n"
+            "large_airport,Nowhere Intl,1.5,2,CL,,\n"
+        )
+        [airport] = fetch_airports(url=str(csv_path), use_cache=False)
+        assert airport.iata_code == "N/A"
+        assert airport.municipality == ""
+        assert airport.longitude == 2.0
+        assert isinstance(airport.longitude, float)
+
+    @responses.activate
+    def test_expired_cache_revalidated_with_etag(
+        self, monkeypatch, tmp_path, sample_airports_csv_path
+    ):
+        import time
+
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        url = "https://example.com/airports.csv"
+        responses.add(
+            responses.GET,
+            url,
+            body=sample_airports_csv_path.read_bytes(),
+            headers={"ETag": '"v1"'},
+        )
+        first = fetch_airports(country_codes={"JP"}, url=url)
+
+        # Past the TTL the server confirms the copy is current
+        now = time.time()
+        monkeypatch.setattr("seismic_risk.cache.time.time", lambda: now + 2 * 86400)
+        responses.replace(responses.GET, url, status=304)
+        second = fetch_airports(country_codes={"JP"}, url=url)
+
+        assert second == first
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_cached_payload_parsed_once(self, monkeypatch, tmp_path, sample_airports_csv_path):
+        import seismic_risk.fetchers.airports as airports_mod
+
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        url = "https://example.com/airports.csv"
+        responses.add(responses.GET, url, body=sample_airports_csv_path.read_bytes())
+        parses = []
+        real_read_csv = airports_mod._read_csv
+        monkeypatch.setattr(
+            airports_mod, "_read_csv", lambda src: parses.append(src) or real_read_csv(src)
+        )
+
+        jp = fetch_airports(country_codes={"JP"}, url=url)
+        cl = fetch_airports(country_codes={"CL"}, url=url)
+
+        assert len(parses) == 1
+        assert {a.iata_code for a in jp} == {"NRT", "HND"}
+        assert [a.iata_code for a in cl] == ["SCL"]
+
     def test_no_matching_type_returns_empty(self, sample_airports_csv_path):
         result = fetch_airports(
             airport_type="heliport",
@@ -283,6 +343,88 @@ class TestFetchCountryMetadata:
         assert "JP" in result
         assert result["JP"]["name"]["common"] == "Japan"
 
+    @responses.activate
+    def test_concurrent_fetch_keeps_sorted_order(self):
+        codes = ["CL", "DE", "JP", "NZ", "XX"]
+        for cc in codes:
+            responses.add(
+                responses.GET,
+                f"https://restcountries.com/v3.1/alpha/{cc}",
+                json=[{"cca2": cc}],
+                status=404 if cc == "XX" else 200,
+            )
+        result = fetch_country_metadata(set(codes), use_cache=False, max_workers=4)
+        assert list(result) == ["CL", "DE", "JP", "NZ"]
+        assert result["NZ"] == {"cca2": "NZ"}
+
+    @responses.activate
+    def test_repeat_call_served_in_process(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        responses.add(
+            responses.GET,
+            "https://restcountries.com/v3.1/alpha/JP",
+            json=[{"cca2": "JP"}],
+            status=200,
+        )
+        first = fetch_country_metadata({"JP"})
+        monkeypatch.setattr(
+            "seismic_risk.fetchers.countries.cache_get_entry",
+            lambda *a, **k: pytest.fail("disk cache consulted"),
+        )
+        second = fetch_country_metadata({"JP"})
+        assert second == first == {"JP": {"cca2": "JP"}}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_disk_cache_stores_compressed_record(self, monkeypatch, tmp_path):
+        import gzip
+
+        from seismic_risk.cache import cache_get
+        from seismic_risk.fetchers import countries
+
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        record = {"cca2": "JP", "translations": {"fra": {"common": "Japon"}}}
+        responses.add(
+            responses.GET,
+            "https://restcountries.com/v3.1/alpha/JP",
+            json=[record],
+            status=200,
+        )
+        fetch_country_metadata({"JP"})
+
+        raw = cache_get("country_JP.json.gz", max_age_seconds=3600)
+        assert raw is not None
+        assert json.loads(gzip.decompress(raw)) == record
+
+        # A fresh process (empty memo) reads the record back from disk
+        countries._memo.clear()
+        assert fetch_country_metadata({"JP"}) == {"JP": record}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_memo_expires_with_disk_entry(self, monkeypatch, tmp_path):
+        from seismic_risk.cache import COUNTRIES_TTL
+        from seismic_risk.fetchers import countries
+
+        monkeypatch.setattr("seismic_risk.cache._CACHE_DIR", tmp_path)
+        responses.add(
+            responses.GET,
+            "https://restcountries.com/v3.1/alpha/JP",
+            json=[{"cca2": "JP"}],
+            status=200,
+        )
+        fetch_country_metadata({"JP"})
+        written_at = time.time()
+
+        # Loaded from disk near the end of its TTL, the memo keeps the
+        # disk entry's write time rather than the load time
+        countries._memo.clear()
+        monkeypatch.setattr(
+            "seismic_risk.cache.time.time", lambda: written_at + COUNTRIES_TTL - 1
+        )
+        fetch_country_metadata({"JP"})
+        assert countries._memo[(countries.REST_COUNTRIES_BASE, "JP")][0] <= written_at
+
     def test_empty_country_codes_returns_empty(self):
         result = fetch_country_metadata(set(), use_cache=False)
         assert result == {}
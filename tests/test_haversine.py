@@ -1,8 +1,9 @@
 """Tests for geo.haversine."""
 
+import numpy as np
 import pytest
 
-from seismic_risk.geo import felt_radius_km, haversine
+from seismic_risk.geo import felt_radius_km, haversine, haversine_batch
 
 
 class TestHaversine:
@@ -34,6 +35,19 @@ class TestHaversine:
         assert haversine(-90, -180, 90, 180) >= 0
 
 
+class TestHaversineBatch:
+    def test_matches_scalar(self):
+        lats = np.array([35.6762, 34.6937, 51.5074, 0.0, -33.8688])
+        lons = np.array([139.6503, 135.5023, -0.1278, 180.0, 151.2093])
+        distances = haversine_batch(35.6762, 139.6503, lats, lons)
+        assert distances.shape == (5,)
+        for d, lat, lon in zip(distances, lats, lons, strict=True):
+            assert d == pytest.approx(haversine(35.6762, 139.6503, lat, lon), abs=1e-9)
+
+    def test_empty(self):
+        assert haversine_batch(0.0, 0.0, np.array([]), np.array([])).shape == (0,)
+
+
 class TestFeltRadius:
     def test_returns_float(self):
         result = felt_radius_km(5.0, 10.0)
@@ -78,3 +92,13 @@ class TestFeltRadius:
         r_neg = felt_radius_km(5.0, -5.0)
         r_zero = felt_radius_km(5.0, 0.0)
         assert r_neg == r_zero
+
+    def test_earthquake_property_matches_function(self):
+        from seismic_risk.models import Earthquake
+
+        eq = Earthquake(
+            id="us1", magnitude=6.1, latitude=35.0, longitude=140.0,
+            depth_km=20.0, time_ms=0, place="Test",
+        )
+        assert eq.felt_radius_km == felt_radius_km(6.1, 20.0)
+        assert "felt_radius_km" in vars(eq)  # cached after first access
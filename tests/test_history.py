@@ -184,6 +184,32 @@ class TestLoadHistory:
         assert len(result) == 1
         assert result[0].date == "2026-02-06"
 
+    def test_ignores_non_snapshot_entries(self, tmp_path: Path) -> None:
+        snap = DailySnapshot(
+            date="2026-02-06",
+            scoring_method="exposure",
+            countries=[CountrySnapshot("JPN", "Japan", 42.0, 3, 2, 5.0)],
+        )
+        _write_snapshot(tmp_path, snap)
+        (tmp_path / "2026-02-07.json").mkdir()
+        (tmp_path / "notes.txt").write_text("not a snapshot")
+
+        result = load_history(tmp_path)
+        assert [s.date for s in result] == ["2026-02-06"]
+
+    def test_repeated_strings_shared_across_days(self, tmp_path: Path) -> None:
+        for d in ["2026-02-05", "2026-02-06"]:
+            snap = DailySnapshot(
+                date=d,
+                scoring_method="exposure",
+                countries=[CountrySnapshot("JPN", "Japan", 40.0, 3, 2, 5.0)],
+            )
+            _write_snapshot(tmp_path, snap)
+
+        first, second = load_history(tmp_path)
+        assert first.countries[0].country is second.countries[0].country
+        assert first.countries[0].iso_alpha3 is second.countries[0].iso_alpha3
+
 
 # ---------------------------------------------------------------------------
 # Trend computation tests
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
+import pytest
 import responses
+from pydantic import ValidationError
 
-from seismic_risk.config import SeismicRiskConfig
-from seismic_risk.pipeline import run_pipeline
+from seismic_risk.config import ScoringMethod, SeismicRiskConfig
+from seismic_risk.pipeline import _airports_by_country, _score_countries, run_pipeline
 
 
 class TestRunPipeline:
@@ -141,3 +146,82 @@ class TestRunPipeline:
             results = run_pipeline(config)
 
         assert results == []
+
+
+class TestScoreCountries:
+    def test_skips_countries_without_metadata(
+        self, sample_earthquakes, sample_airports, default_config,
+    ):
+        """Countries missing REST Countries metadata produce no result."""
+        results = _score_countries(
+            earthquakes=sample_earthquakes,
+            airports_by_country={"JP": sample_airports},
+            rest_data={},
+            significant_quakes={},
+            shakemap_grids={},
+            config=default_config,
+        )
+        assert results == []
+
+
+class TestAirportIndex:
+    def test_reused_across_runs_when_caching(self, sample_airports):
+        session = MagicMock()
+        with patch("seismic_risk.pipeline.fetch_airports", return_value=sample_airports) as fetch:
+            first = _airports_by_country("large_airport", session, use_cache=True)
+            second = _airports_by_country("large_airport", session, use_cache=True)
+
+        fetch.assert_called_once()
+        assert second is first
+        assert first["JP"] == tuple(sample_airports)
+
+    def test_rebuilt_when_caching_disabled(self, sample_airports):
+        session = MagicMock()
+        with patch("seismic_risk.pipeline.fetch_airports", return_value=sample_airports) as fetch:
+            _airports_by_country("large_airport", session, use_cache=False)
+            _airports_by_country("large_airport", session, use_cache=False)
+
+        assert fetch.call_count == 2
+
+    def test_uncached_fetch_filters_countries(self, sample_airports):
+        session = MagicMock()
+        with patch("seismic_risk.pipeline.fetch_airports", return_value=sample_airports) as fetch:
+            _airports_by_country("large_airport", session, use_cache=False, country_codes={"JP"})
+
+        assert fetch.call_args.kwargs["country_codes"] == {"JP"}
+
+    def test_concurrent_cold_lookups_build_once(self, sample_airports):
+        session = MagicMock()
+        barrier = threading.Barrier(4)
+
+        def slow_fetch(**kwargs):
+            time.sleep(0.05)
+            return sample_airports
+
+        def lookup(_):
+            barrier.wait()
+            return _airports_by_country("large_airport", session, use_cache=True)
+
+        with (
+            patch("seismic_risk.pipeline.fetch_airports", side_effect=slow_fetch) as fetch,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            results = list(pool.map(lookup, range(4)))
+
+        fetch.assert_called_once()
+        assert all(r is results[0] for r in results)
+
+
+class TestConfig:
+    def test_config_is_hashable(self, default_config):
+        """Frozen configs can key memoized helpers."""
+        assert hash(default_config) == hash(default_config.model_copy())
+        with pytest.raises(ValidationError):
+            default_config.min_magnitude = 6.0  # type: ignore[misc]
+
+    def test_enum_fields_accept_and_equal_strings(self):
+        config = SeismicRiskConfig(scoring_method="legacy", output_format="csv")
+        assert config.scoring_method is ScoringMethod.LEGACY
+        assert config.output_format == "csv"
+        assert f"{config.output_format}" == "csv"
+        assert {"csv": 1}[config.output_format] == 1
@@ -360,6 +360,14 @@ class TestFindExposedAirportsEnriched:
         for ap in exposed:
             assert ap.exposure_score > 0
 
+    def test_sorted_by_exposure_score(self, sample_airports, sample_earthquakes):
+        exposed = find_exposed_airports(
+            sample_airports, sample_earthquakes, max_distance_km=400
+        )
+        scores = [ap.exposure_score for ap in exposed]
+        assert len(scores) > 1
+        assert scores == sorted(scores, reverse=True)
+
     def test_nearby_quakes_sorted_by_distance(self, sample_airports, sample_earthquakes):
         exposed = find_exposed_airports(
             sample_airports, sample_earthquakes, max_distance_km=400
@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 import responses
 from requests.exceptions import ConnectionError as RequestsConnectionError
+from responses import matchers
 
 from seismic_risk.fetchers.shakemap import (
     ShakeMapGrid,
@@ -15,6 +16,7 @@ from seismic_risk.fetchers.shakemap import (
     _parse_grid_xml,
     fetch_shakemap_grids,
     interpolate_pga,
+    interpolate_pga_batch,
 )
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -36,7 +38,7 @@ def sample_grid() -> ShakeMapGrid:
             [3.0, 5.0, 8.0, 5.0, 3.0],
             [2.0, 3.0, 4.0, 3.0, 2.0],
         ],
-        dtype=np.float64,
+        dtype=np.float32,
     )
     mmi = np.array(
         [
@@ -46,7 +48,7 @@ def sample_grid() -> ShakeMapGrid:
             [3.5, 4.5, 5.5, 4.5, 3.5],
             [3.0, 3.5, 4.0, 3.5, 3.0],
         ],
-        dtype=np.float64,
+        dtype=np.float32,
     )
     return ShakeMapGrid(
         event_id="us2025test",
@@ -75,6 +77,8 @@ class TestParseGridXml:
         assert grid.lon_spacing == 0.25
         assert grid.pga.shape == (5, 5)
         assert grid.mmi.shape == (5, 5)
+        assert grid.pga.dtype == np.float32
+        assert grid.mmi.dtype == np.float32
         # Center value: PGA=15.0 %g, MMI=7.0
         assert grid.pga[2, 2] == 15.0
         assert grid.mmi[2, 2] == 7.0
@@ -105,6 +109,35 @@ class TestParseGridXml:
         result = _parse_grid_xml(xml, "bad")
         assert result is None
 
+    def test_non_numeric_value_returns_none(self) -> None:
+        xml = (
+            b'<?xml version="1.0"?>'
+            b"<shakemap_grid>"
+            b'<grid_specification lon_min="0" lon_max="1" lat_min="0" lat_max="1"'
+            b' nominal_lon_spacing="1" nominal_lat_spacing="1" nlon="1" nlat="1" />'
+            b"<grid_data>\n"
+            b"0.0 1.0 3.0 n/a 2.0 4.0 3.0 2.0 400\n"
+            b"</grid_data>"
+            b"</shakemap_grid>"
+        )
+        result = _parse_grid_xml(xml, "bad")
+        assert result is None
+
+    def test_short_row_returns_none(self) -> None:
+        xml = (
+            b'<?xml version="1.0"?>'
+            b"<shakemap_grid>"
+            b'<grid_specification lon_min="0" lon_max="1" lat_min="0" lat_max="1"'
+            b' nominal_lon_spacing="1" nominal_lat_spacing="1" nlon="1" nlat="2" />'
+            b"<grid_data>\n"
+            b"0.0 1.0 3.0 5.0 2.0 4.0 3.0 2.0 400\n"
+            b"0.0 1.0\n"
+            b"</grid_data>"
+            b"</shakemap_grid>"
+        )
+        result = _parse_grid_xml(xml, "bad")
+        assert result is None
+
 
 class TestInterpolatePga:
     def test_exact_grid_point_center(self, sample_grid: ShakeMapGrid) -> None:
@@ -145,6 +178,26 @@ class TestInterpolatePga:
         assert mmi == pytest.approx(3.0)
 
 
+class TestInterpolatePgaBatch:
+    def test_matches_scalar(self, sample_grid: ShakeMapGrid) -> None:
+        lats = np.array([35.5, 36.0, 36.0, 35.0, 35.37, 35.81])
+        lons = np.array([139.5, 139.0, 139.125, 140.0, 139.62, 139.04])
+        pga, mmi = interpolate_pga_batch(sample_grid, lats, lons)
+        for i in range(len(lats)):
+            expected = interpolate_pga(sample_grid, lat=lats[i], lon=lons[i])
+            assert expected is not None
+            assert (pga[i], mmi[i]) == expected
+
+    def test_outside_bounds_is_nan(self, sample_grid: ShakeMapGrid) -> None:
+        pga, mmi = interpolate_pga_batch(
+            sample_grid, np.array([35.5, 37.0, 35.5]), np.array([138.0, 139.5, 139.5]),
+        )
+        assert np.isnan(pga[:2]).all()
+        assert np.isnan(mmi[:2]).all()
+        assert pga[2] == pytest.approx(15.0)
+        assert mmi[2] == pytest.approx(7.0)
+
+
 class TestExtractGridUrl:
     def test_valid_detail(self) -> None:
         detail = {
@@ -288,3 +341,32 @@ class TestFetchShakemapGrids:
             use_cache=False,
         )
         assert result == {}
+
+    @responses.activate
+    def test_concurrent_fetch_keeps_sorted_order(self, sample_grid_xml: bytes) -> None:
+        for eid in ("eq3", "eq1", "eq2"):
+            contents = (
+                {"download/grid.xml": {"url": f"https://earthquake.usgs.gov/{eid}/grid.xml"}}
+                if eid != "eq2" else {}
+            )
+            responses.add(
+                responses.GET,
+                "https://earthquake.usgs.gov/fdsnws/event/1/query",
+                match=[matchers.query_param_matcher({"eventid": eid, "format": "geojson"})],
+                json={"properties": {"products": {"shakemap": [{"contents": contents}]}}},
+                status=200,
+            )
+            responses.add(
+                responses.GET,
+                f"https://earthquake.usgs.gov/{eid}/grid.xml",
+                body=sample_grid_xml,
+                status=200,
+            )
+        result = fetch_shakemap_grids(
+            earthquake_ids={"eq1", "eq2", "eq3"},
+            event_types=dict.fromkeys(("eq1", "eq2", "eq3"), ",shakemap,"),
+            use_cache=False,
+            max_workers=3,
+        )
+        assert list(result) == ["eq1", "eq3"]
+        assert result["eq3"].event_id == "eq3"